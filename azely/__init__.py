@@ -1,29 +1,94 @@
 __all__ = [
+    "acompute",
+    "aget_location",
+    "aget_object",
     "azel",
+    "backend",
     "compute",
+    "compute_chunks",
+    "compute_many",
+    "compute_sites",
     "consts",
+    "event",
+    "events",
     "get_location",
     "get_object",
+    "get_objects",
     "get_time",
     "location",
+    "metrics",
     "object",
     "time",
     "utils",
+    "visibility",
 ]
 __version__ = "0.7.0"
 
 
-# submodules
-from . import azel
-from . import consts
-from . import location
-from . import object
-from . import time
-from . import utils
+# standard library
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 
-# aliases
-from .azel import compute
-from .location import get_location
-from .object import get_object
-from .time import get_time
+# submodules and aliases (imported on first access)
+SUBMODULES = (
+    "azel",
+    "backend",
+    "consts",
+    "event",
+    "location",
+    "metrics",
+    "object",
+    "time",
+    "utils",
+)
+ALIASES = {
+    "acompute": "azel",
+    "aget_location": "location",
+    "aget_object": "object",
+    "compute": "azel",
+    "compute_chunks": "azel",
+    "compute_many": "azel",
+    "compute_sites": "azel",
+    "events": "event",
+    "get_location": "location",
+    "get_object": "object",
+    "get_objects": "object",
+    "get_time": "time",
+    "visibility": "event",
+}
+
+
+if TYPE_CHECKING:
+    from . import azel
+    from . import backend
+    from . import consts
+    from . import event
+    from . import location
+    from . import metrics
+    from . import object
+    from . import time
+    from . import utils
+    from .azel import acompute, compute, compute_chunks, compute_many, compute_sites
+    from .event import events, visibility
+    from .location import aget_location, get_location
+    from .object import aget_object, get_object, get_objects
+    from .time import get_time
+
+
+def __getattr__(name: str) -> Any:
+    """Import a submodule or an alias on first access."""
+    if name in SUBMODULES:
+        return import_module(f".{name}", __name__)
+
+    if name in ALIASES:
+        module = import_module(f".{ALIASES[name]}", __name__)
+        globals()[name] = attr = getattr(module, name)
+        return attr
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the names of the module including lazy ones."""
+    return sorted({*globals(), *__all__})
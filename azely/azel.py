@@ -1,15 +1,37 @@
-__all__ = ["AzEl", "compute"]
+__all__ = [
+    "AzEl",
+    "acompute",
+    "compute",
+    "compute_chunks",
+    "compute_many",
+    "compute_sites",
+]
+
+
+# standard library
+from collections import defaultdict
+from concurrent.futures import Executor
+from threading import Event
+from datetime import tzinfo
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
 
 
 # dependent packages
-from pandas import DataFrame, DatetimeIndex, Timestamp, to_timedelta
+import numpy as np
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord, get_body
+from astropy.time import Time as ObsTime
+from astropy.utils import iers
+from pandas import DataFrame, DatetimeIndex, Index, Timestamp, concat, to_timedelta
+from . import utils
 from .location import Location, get_location
 from .object import Object, get_object
-from .time import Time, get_time
+from .time import CHUNK_SIZE, Time, get_time, get_time_chunks, get_tzinfo
+from .utils import AzelyError, run_async, stage, submit
 
 
 # constants
 from .consts import (
+    AZELY_CACHE,
     DAYFIRST,
     FRAME,
     FREQ,
@@ -20,7 +42,13 @@ from .consts import (
     YEARFIRST,
 )
 
+ARCSEC = np.pi / 648_000
+COLUMNS = ("az", "el", "lst")
+ENGINES = ("astropy", "fast")
+J2000 = Timestamp("2000-01-01 12:00:00", tz="UTC").value
+J2000_JD = 2_451_545.0
 SOLAR_TO_SIDEREAL = 1.002_737_909
+TT_MINUS_UTC = 69.184
 
 
 # data class
@@ -37,19 +65,71 @@ class AzEl(DataFrame):
 
     @property
     def in_lst(self):
-        """Convert time index to LST."""
-        td = self.index - self.index[0]
-        td_lst = td * SOLAR_TO_SIDEREAL + self.lst[0]
-        td_lst = td_lst.floor("1D") + self.lst
+        """Convert time index to LST.
 
-        lst = Timestamp(0) + td_lst
-        return self.set_index(DatetimeIndex(lst, name="LST"))
+        The LST index is cached until the time index or the LST column
+        is replaced (but not if the LST column is modified in place),
+        and the returned DataFrame shares the column data with the original one.
+
+        """
+        return self._with_index(self._cached_index("LST", self._lst_index, "lst"))
 
     @property
     def in_utc(self):
-        """Convert time index to UTC."""
+        """Convert time index to UTC.
+
+        The UTC index is cached until the time index is replaced,
+        and the returned DataFrame shares the column data with the original one.
+
+        """
+        return self._with_index(self._cached_index("UTC", self._utc_index))
+
+    def _cached_index(
+        self,
+        name: str,
+        func: Callable[[], Index],
+        column: Optional[str] = None,
+    ) -> Index:
+        """Return a derived index cached on the instance per time index (and column).
+
+        The column is identified by the memory of its data, which is kept
+        referenced by the cache so that it is never reused by another column.
+
+        """
+        cache = self.__dict__.setdefault("_indexes", {})
+        data = None if column is None else self[column].to_numpy()
+
+        if (
+            (item := cache.get(name)) is None
+            or item[0] is not self.index
+            or (data is not None and not _same_memory(item[1], data))
+        ):
+            cache[name] = item = self.index, data, func()
+
+        return item[2]
+
+    def _lst_index(self) -> DatetimeIndex:
+        """Compute LST index from time index and LST."""
+        if (lst := self.lst.to_numpy()).dtype.kind == "f":
+            lst = to_timedelta(lst.astype(float), unit="hr")
+
+        td = to_timedelta((self.index - self.index[0]).to_numpy())
+        td_lst = td * SOLAR_TO_SIDEREAL + lst[0]
+        td_lst = td_lst.floor("1D") + lst
+
+        lst = Timestamp(0) + td_lst
+        return DatetimeIndex(lst, name="LST")
+
+    def _utc_index(self) -> DatetimeIndex:
+        """Compute UTC index from time index."""
         utc = self.index.tz_convert("UTC")
-        return self.set_index(DatetimeIndex(utc, name="UTC"))
+        return DatetimeIndex(utc, name="UTC")
+
+    def _with_index(self, index: Index) -> "AzEl":
+        """Return a shallow copy (sharing the column data) with a new index."""
+        azel = self.copy(deep=False)
+        azel.index = index
+        return azel
 
     @property
     def _constructor(self):
@@ -68,6 +148,10 @@ def compute(
     dayfirst: bool = DAYFIRST,
     yearfirst: bool = YEARFIRST,
     timeout: int = TIMEOUT,
+    engine: str = "astropy",
+    tolerance: Optional[float] = None,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[str] = None,
 ) -> AzEl:
     """Compute az/el and local sidereal time (LST) of an astronomical object.
 
@@ -85,6 +169,8 @@ def compute(
     There are two different locations to be used for a computation:
     (1) ``site``: location where az/el of an object is computed.
     (2) ``view``: location where time information (timezone) is considered.
+    They are resolved concurrently with object information, and the site is reused
+    as the view if the view is not specified or is the same as the site.
 
     Args:
         object: Query string for object information (e.g., ``'Sun'`` or ``'NGC1068'``).
@@ -105,6 +191,19 @@ def compute(
             ``'01-02-03'`` is treated as Feb. 3rd 2001. If ``dayfirst`` is also ``True``,
             then it will be Mar. 2nd 2001.
         timeout: (common option) Query timeout expressed in units of seconds.
+        engine: (compute option) Engine of az/el computation. Either ``'astropy'``
+            (by default; astropy's full transform) or ``'fast'`` (closed-form
+            approximation accurate to about 1 arcsec; see ``_compute`` for details).
+        tolerance: (compute option) Tolerance (arcsec) of interpolated ephemeris
+            of a solar object. If specified, its position is interpolated from
+            a coarse grid of time and the achieved error (arcsec) is stored in
+            ``df.attrs['ephemeris_error']``. By default, it is computed exactly.
+        columns: (compute option) Names of columns to be computed (e.g., ``['el']``).
+            By default, all columns (``'az'``, ``'el'``, and ``'lst'``) are computed.
+            If ``'lst'`` is not included, sidereal time is not computed at all.
+        dtype: (compute option) Data type of the columns (e.g., ``'float32'``).
+            If specified, LST is expressed as float hours of the same data type.
+            By default, az/el are float64 and LST is timedelta64.
 
     Returns:
         Computed DataFrame of object's az/el and LST at given site and view.
@@ -126,24 +225,323 @@ def compute(
             >>> df = azely.compute('Sun', 'Tokyo', '1/1 12:00 to 12/31 12:00', freq='1D')
 
     """  # noqa: E501
-    object_ = get_object(object, frame=frame, timeout=timeout)
+    object_, site_, tzinfo_ = _resolve(object, site, view, frame, timeout)
+    time_ = get_time(time, tzinfo_, freq, dayfirst, yearfirst, timeout)
+    return _compute(object_, site_, time_, engine, tolerance, columns, dtype)
+
+
+async def acompute(
+    object: str,
+    site: str = SITE,
+    time: str = TIME,
+    view: str = VIEW,
+    frame: str = FRAME,
+    freq: str = FREQ,
+    dayfirst: bool = DAYFIRST,
+    yearfirst: bool = YEARFIRST,
+    timeout: int = TIMEOUT,
+    engine: str = "astropy",
+    tolerance: Optional[float] = None,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> AzEl:
+    """Compute az/el and LST of an astronomical object without blocking the event loop.
+
+    This is the async counterpart of ``compute`` for asyncio applications
+    (e.g., web backends). Object, site, and view information is resolved
+    concurrently (see ``compute``) and then time information is computed
+    in the default executor of the running event loop, while az/el and LST
+    are computed in the given executor.
+    Context variables (e.g., those of ``timings``) are propagated to the executors.
+
+    Args:
+        object: Query string for object information (e.g., ``'Sun'`` or ``'NGC1068'``).
+        site: Query string for location information at a site (e.g., ``'Tokyo'``).
+        time: Query string for time information at a view (e.g., ``'2020-01-01'``).
+        view: Query string for timezone information at the view. (e.g., ``'Asia/Tokyo'``,
+            ``'UTC'``, or ``Tokyo``). By default (``''``),  timezone at the site is used.
+        frame: (object option) Name of equatorial coordinates used in astropy's SkyCoord.
+        freq: (time option) Frequency of time samples as the same format of pandas offset
+            aliases (e.g., ``'1D'`` -> 1 day, ``'3H'`` -> 3 hours, ``'10T'`` -> 10 minutes).
+        dayfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the day.
+        yearfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the year.
+        timeout: (common option) Query timeout expressed in units of seconds.
+        engine: (compute option) Engine of az/el computation (see ``compute``).
+        tolerance: (compute option) Tolerance (arcsec) of interpolated ephemeris
+            of a solar object (see ``compute``).
+        columns: (compute option) Names of columns to be computed (see ``compute``).
+        dtype: (compute option) Data type of the columns (see ``compute``).
+        executor: (compute option) Executor of the computation (e.g., a ThreadPoolExecutor
+            or a ProcessPoolExecutor). By default, the one set by ``azely.utils.set_executor``
+            is used, or the default executor of the event loop if it is not set.
+            Note that stages of the computation are not recorded by ``timings``
+            if it is run in a process pool.
+
+    Returns:
+        Computed DataFrame of object's az/el and LST at given site and view.
+
+    Raises:
+        AzelyError: Raised if one of mid-level APIs fails to get any information.
+
+    Examples:
+        To compute daily az/el of NGC1068 at ALMA AOS in a coroutine::
+
+            >>> df = await azely.acompute('NGC1068', 'ALMA AOS', '2020-02-01')
+
+    """  # noqa: E501
+    object_, site_, tzinfo_ = await run_async(
+        _resolve, object, site, view, frame, timeout
+    )
+
+    time_ = await run_async(get_time, time, tzinfo_, freq, dayfirst, yearfirst, timeout)
+
+    return await run_async(
+        _compute,
+        object_,
+        site_,
+        time_,
+        engine,
+        tolerance,
+        columns,
+        dtype,
+        executor=executor or utils.compute_executor,
+    )
+
+
+def compute_chunks(
+    object: str,
+    site: str = SITE,
+    time: str = TIME,
+    view: str = VIEW,
+    frame: str = FRAME,
+    freq: str = FREQ,
+    dayfirst: bool = DAYFIRST,
+    yearfirst: bool = YEARFIRST,
+    timeout: int = TIMEOUT,
+    engine: str = "astropy",
+    tolerance: Optional[float] = None,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[str] = None,
+    size: int = CHUNK_SIZE,
+    progress: Optional[Callable[[int], Any]] = None,
+    cancel: Optional[Event] = None,
+) -> Iterator[AzEl]:
+    """Compute az/el and local sidereal time (LST) of an object by chunks of time.
+
+    Similar to ``compute`` function, but this function returns a generator
+    that yields computed DataFrames of consecutive chunks of time (each of which
+    has at most ``size`` time samples). Since the time samples, astropy's objects,
+    and DataFrame are created chunk by chunk, the memory usage is bounded
+    regardless of the length of time range and ``freq``.
+
+    Object and location information are obtained when the function is called,
+    while each chunk is computed when the generator is iterated.
+
+    Args:
+        object: Query string for object information (e.g., ``'Sun'`` or ``'NGC1068'``).
+        site: Query string for location information at a site (e.g., ``'Tokyo'``).
+        time: Query string for time information at a view (e.g., ``'2020-01-01'``).
+        view: Query string for timezone information at the view. (e.g., ``'Asia/Tokyo'``,
+            ``'UTC'``, or ``Tokyo``). By default (``''``),  timezone at the site is used.
+        frame: (object option) Name of equatorial coordinates used in astropy's SkyCoord.
+        freq: (time option) Frequency of time samples as the same format of pandas offset
+            aliases (e.g., ``'1D'`` -> 1 day, ``'3H'`` -> 3 hours, ``'10T'`` -> 10 minutes).
+        dayfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the day.
+        yearfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the year.
+        timeout: (common option) Query timeout expressed in units of seconds.
+        engine: (compute option) Engine of az/el computation (see ``compute``).
+        tolerance: (compute option) Tolerance (arcsec) of interpolated ephemeris
+            of a solar object (see ``compute``).
+        columns: (compute option) Names of columns to be computed (see ``compute``).
+        dtype: (compute option) Data type of the columns (see ``compute``).
+        size: (chunk option) Maximum number of time samples in a chunk.
+        progress: (chunk option) Function called with the total number of
+            time samples computed so far after each chunk is computed.
+        cancel: (chunk option) Event which stops the generator before
+            the next chunk is computed once it is set (e.g., by another thread).
+
+    Returns:
+        Generator of computed DataFrames of object's az/el and LST
+        at given site and view (one per chunk).
+
+    Raises:
+        AzelyError: Raised if one of mid-level APIs fails to get any information.
+
+    Examples:
+        To compute az/el of NGC1068 at ALMA AOS in 10 years at 1-minute resolution::
+
+            >>> for df in azely.compute_chunks(
+                    'NGC1068', 'ALMA AOS', '2020-01-01 to 2030-01-01', freq='1T'
+                ):
+                    df.to_csv('ngc1068.csv', mode='a')
+
+    """  # noqa: E501
+    object_, site_, tzinfo_ = _resolve(object, site, view, frame, timeout)
+    times = get_time_chunks(time, tzinfo_, freq, dayfirst, yearfirst, timeout, size)
+
+    return _compute_chunks(
+        object_,
+        site_,
+        times,
+        engine,
+        tolerance,
+        columns,
+        dtype,
+        progress,
+        cancel,
+    )
+
+
+def compute_many(
+    objects: Sequence[str],
+    site: str = SITE,
+    time: str = TIME,
+    view: str = VIEW,
+    frame: str = FRAME,
+    freq: str = FREQ,
+    dayfirst: bool = DAYFIRST,
+    yearfirst: bool = YEARFIRST,
+    timeout: int = TIMEOUT,
+) -> AzEl:
+    """Compute az/el and local sidereal time (LST) of many astronomical objects.
+
+    Similar to ``compute`` function, but this function receives a sequence
+    of object queries and computes all of them over the same site and time.
+    Objects in the same equatorial coordinates are transformed to az/el at once,
+    which is much faster than calling ``compute`` function for each object.
+
+    Args:
+        objects: Query strings for object information (e.g., ``['Sun', 'NGC1068']``).
+        site: Query string for location information at a site (e.g., ``'Tokyo'``).
+        time: Query string for time information at a view (e.g., ``'2020-01-01'``).
+        view: Query string for timezone information at the view. (e.g., ``'Asia/Tokyo'``,
+            ``'UTC'``, or ``Tokyo``). By default (``''``),  timezone at the site is used.
+        frame: (object option) Name of equatorial coordinates used in astropy's SkyCoord.
+        freq: (time option) Frequency of time samples as the same format of pandas offset
+            aliases (e.g., ``'1D'`` -> 1 day, ``'3H'`` -> 3 hours, ``'10T'`` -> 10 minutes).
+        dayfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the day.
+        yearfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the year.
+        timeout: (common option) Query timeout expressed in units of seconds.
+
+    Returns:
+        Computed DataFrame of objects' az/el and LST at given site and view.
+        Its columns are two-level (object name and az/el/LST), so that
+        ``df['NGC1068']`` selects az/el and LST of each object.
+        Duplicate queries are computed (and included) only once.
+        Note that the same LST column is stored for each object
+        (i.e., it takes a third of the memory of the DataFrame),
+        so that ``df['NGC1068']`` can be used as a result of ``compute``.
+
+    Raises:
+        AzelyError: Raised if no objects are given or if one of mid-level APIs
+            fails to get any information.
+
+    Examples:
+        To compute daily az/el of NGC1068 and 3C 273 at ALMA AOS::
+
+            >>> df = azely.compute_many(['NGC1068', '3C 273'], 'ALMA AOS', '2020-02-01')
+
+    """  # noqa: E501
+    objects_ = [
+        get_object(obj, frame=frame, timeout=timeout) for obj in dict.fromkeys(objects)
+    ]
     site_ = get_location(site, timeout=timeout)
     time_ = get_time(time, view or site, freq, dayfirst, yearfirst, timeout)
 
-    return _compute(object_, site_, time_)
+    return _compute_many(objects_, site_, time_)
+
+
+def compute_sites(
+    object: str,
+    sites: Sequence[str],
+    time: str = TIME,
+    view: str = VIEW,
+    frame: str = FRAME,
+    freq: str = FREQ,
+    dayfirst: bool = DAYFIRST,
+    yearfirst: bool = YEARFIRST,
+    timeout: int = TIMEOUT,
+) -> AzEl:
+    """Compute az/el and local sidereal time (LST) of an object at many sites.
+
+    Similar to ``compute`` function, but this function receives a sequence
+    of site queries and computes the object at all of them over the same time.
+    The sites are packed into one array of EarthLocation and transformed at once,
+    which is much faster than calling ``compute`` function for each site.
+
+    Args:
+        object: Query string for object information (e.g., ``'Sun'`` or ``'NGC1068'``).
+        sites: Query strings for location information (e.g., ``['ALMA AOS', 'Tokyo']``).
+        time: Query string for time information at a view (e.g., ``'2020-01-01'``).
+        view: Query string for timezone information at the view. (e.g., ``'Asia/Tokyo'``,
+            ``'UTC'``, or ``Tokyo``). By default (``''``), timezone at the first site is used.
+        frame: (object option) Name of equatorial coordinates used in astropy's SkyCoord.
+        freq: (time option) Frequency of time samples as the same format of pandas offset
+            aliases (e.g., ``'1D'`` -> 1 day, ``'3H'`` -> 3 hours, ``'10T'`` -> 10 minutes).
+        dayfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the day.
+        yearfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the year.
+        timeout: (common option) Query timeout expressed in units of seconds.
+
+    Returns:
+        Computed DataFrame of object's az/el and LST at given sites and view.
+        Its columns are two-level (site name and az/el/LST), so that
+        ``df['Tokyo']`` selects az/el and LST at each site.
+
+    Raises:
+        AzelyError: Raised if one of mid-level APIs fails to get any information.
+
+    Examples:
+        To compute daily az/el of NGC1068 at ALMA AOS and Nobeyama::
+
+            >>> df = azely.compute_sites('NGC1068', ['ALMA AOS', 'Nobeyama'], '2020-02-01')
+
+    """  # noqa: E501
+    object_ = get_object(object, frame=frame, timeout=timeout)
+    sites_ = [get_location(site, timeout=timeout) for site in sites]
+    time_ = get_time(time, view or sites[0], freq, dayfirst, yearfirst, timeout)
+
+    return _compute_sites(object_, sites_, time_)
 
 
 # helper functions
-def _compute(object: Object, site: Location, time: Time) -> AzEl:
+def _compute(
+    object: Object,
+    site: Location,
+    time: Time,
+    engine: str = "astropy",
+    tolerance: Optional[float] = None,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[str] = None,
+) -> AzEl:
     """Compute az/el and local sidereal time (LST) of an astronomical object.
 
     Similar to ``compute`` function, but this function receives instances
     of ``Object``, ``Location``, and ``Time`` classes as arguments.
 
+    If ``engine='fast'`` is specified, az/el of a non-solar object is computed
+    by closed-form NumPy expressions instead of astropy's transform: IAU 2006
+    sidereal time, IAU 1976 precession, the four largest nutation terms,
+    annual aberration, and a refraction-free hour angle to az/el conversion.
+    UT1 is given by astropy's IERS table, and the error is about 1 arcsec.
+    Solar objects are always computed by astropy.
+
     Args:
         object: Object information.
         site: Site location information.
         time: Time information.
+        engine: Engine of az/el computation (either ``'astropy'`` or ``'fast'``).
+        tolerance: Tolerance (arcsec) of interpolated ephemeris of a solar object.
+        columns: Names of columns to be computed (all columns by default).
+        dtype: Data type of the columns (LST is expressed as float hours if specified).
 
     Returns:
         Computed DataFrame of object's az/el and LST at given site and view.
@@ -152,14 +550,367 @@ def _compute(object: Object, site: Location, time: Time) -> AzEl:
         AzelyError: Raised if one of mid-level APIs fails to get any information.
 
     """
+    if engine not in ENGINES:
+        raise AzelyError(f"Engine must be one of {ENGINES}: {engine}")
+
+    if columns is None:
+        columns = COLUMNS
+
+    if unknown := set(columns) - set(COLUMNS):
+        raise AzelyError(f"Columns must be in {COLUMNS}: {sorted(unknown)}")
+
+    if engine == "fast" and not object.is_solar:
+        with stage("transform"):
+            az, el, lst = _compute_fast(object, site, time)
+    else:
+        with stage("obstime"):
+            obstime = time.to_obstime(site.to_earthlocation())
+
+        with stage("transform"):
+            skycoord = object.to_skycoord(obstime, tolerance)
+            altaz = skycoord.altaz
+            az, el = altaz.az.deg, altaz.alt.deg  # type: ignore
+
+        if "lst" in columns:
+            with stage("sidereal_time"):
+                lst = obstime.sidereal_time("mean").hour  # type: ignore
+        else:
+            lst = None
+
+    with stage("dataframe"):
+        if dtype is None and lst is not None:
+            lst = to_timedelta(lst, unit="hr")
+
+        data = dict(az=az, el=el, lst=lst)
+        azel = AzEl(
+            {name: np.asarray(data[name], dtype) for name in columns},
+            index=time.to_index(),
+        )
+        azel.object = object
+        azel.site = site
+
+    if object.is_solar and tolerance is not None:
+        azel.attrs["ephemeris_error"] = skycoord.info.meta["ephemeris_error"]
+
+    return azel
+
+
+def _compute_chunks(
+    object: Object,
+    site: Location,
+    times: Iterable[Time],
+    engine: str = "astropy",
+    tolerance: Optional[float] = None,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[str] = None,
+    progress: Optional[Callable[[int], Any]] = None,
+    cancel: Optional[Event] = None,
+) -> Iterator[AzEl]:
+    """Compute az/el and local sidereal time (LST) of an object by chunks of time.
+
+    Similar to ``compute_chunks`` function, but this function receives instances
+    of ``Object`` and ``Location`` classes and chunks of ``Time`` class as arguments.
+
+    Args:
+        object: Object information.
+        site: Site location information.
+        times: Chunks of time information.
+        engine: Engine of az/el computation (either ``'astropy'`` or ``'fast'``).
+        tolerance: Tolerance (arcsec) of interpolated ephemeris of a solar object.
+        columns: Names of columns to be computed (all columns by default).
+        dtype: Data type of the columns (LST is expressed as float hours if specified).
+        progress: Function called with the number of computed time samples.
+        cancel: Event which stops the generator once it is set.
+
+    Yields:
+        Computed DataFrame of object's az/el and LST of each chunk.
+
+    Raises:
+        AzelyError: Raised if one of mid-level APIs fails to get any information.
+
+    """
+    done = 0
+
+    for time in times:
+        if cancel is not None and cancel.is_set():
+            return
+
+        azel = _compute(object, site, time, engine, tolerance, columns, dtype)
+        done += len(time)
+
+        if progress is not None:
+            progress(done)
+
+        yield azel
+
+
+def _compute_fast(object: Object, site: Location, time: Time) -> tuple[Any, ...]:
+    """Compute az/el (deg) and LST (hr) of a non-solar object by NumPy."""
+    icrs = SkyCoord(*object.values, unit="deg", frame=object.frame).icrs
+    ra, dec = icrs.ra.rad, icrs.dec.rad  # type: ignore
+    lon, lat = np.deg2rad(site.values[:2])
+
+    # days (UTC) and centuries (TT) from J2000.0
+    days = (time.asi8 - J2000) / 86_400e9
+    t = (days + TT_MINUS_UTC / 86_400) / 36_525
+
+    # precession from J2000.0 to mean equinox of date (IAU 1976)
+    zeta = (2306.2181 * t + 0.30188 * t**2 + 0.017998 * t**3) * ARCSEC
+    z = (2306.2181 * t + 1.09468 * t**2 + 0.018203 * t**3) * ARCSEC
+    theta = (2004.3109 * t - 0.42665 * t**2 - 0.041833 * t**3) * ARCSEC
+
+    a = np.cos(dec) * np.sin(ra + zeta)
+    b = np.cos(theta) * np.cos(dec) * np.cos(ra + zeta) - np.sin(theta) * np.sin(dec)
+    c = np.sin(theta) * np.cos(dec) * np.cos(ra + zeta) + np.cos(theta) * np.sin(dec)
+    ra, dec = np.arctan2(a, b) + z, np.arcsin(c)
+
+    # nutation (four largest terms) and obliquity of date
+    om = np.deg2rad(125.04452 - 1934.136261 * t)
+    ls = np.deg2rad(280.4665 + 36000.7698 * t)
+    lm = np.deg2rad(218.3165 + 481267.8813 * t)
+    dpsi = (
+        -17.20 * np.sin(om)
+        - 1.32 * np.sin(2 * ls)
+        - 0.23 * np.sin(2 * lm)
+        + 0.21 * np.sin(2 * om)
+    ) * ARCSEC
+    deps = (
+        +9.20 * np.cos(om)
+        + 0.57 * np.cos(2 * ls)
+        + 0.10 * np.cos(2 * lm)
+        - 0.09 * np.cos(2 * om)
+    ) * ARCSEC
+    eps = np.deg2rad(23.439291 - 0.0130042 * t) + deps
+
+    # true longitude of the Sun for annual aberration
+    m = np.deg2rad(357.52911 + 35999.05029 * t)
+    lam = np.deg2rad(
+        280.46646
+        + 36000.76983 * t
+        + (1.914602 - 0.004817 * t) * np.sin(m)
+        + 0.019993 * np.sin(2 * m)
+    )
+    kappa = 20.49552 * ARCSEC
+
+    dra = (
+        (np.cos(eps) + np.sin(eps) * np.sin(ra) * np.tan(dec)) * dpsi
+        - np.cos(ra) * np.tan(dec) * deps
+        - kappa
+        * (np.cos(ra) * np.cos(lam) * np.cos(eps) + np.sin(ra) * np.sin(lam))
+        / np.cos(dec)
+    )
+    ddec = (
+        np.sin(eps) * np.cos(ra) * dpsi
+        + np.sin(ra) * deps
+        - kappa
+        * (
+            np.cos(lam)
+            * np.cos(eps)
+            * (np.tan(eps) * np.cos(dec) - np.sin(ra) * np.sin(dec))
+            + np.cos(ra) * np.sin(dec) * np.sin(lam)
+        )
+    )
+    ra, dec = ra + dra, dec + ddec
+
+    # UT1 by the IERS table (as astropy's transform), sidereal time (IAU 2006),
+    # and hour angle
+    ut1_utc = iers.earth_orientation_table.get().ut1_utc(J2000_JD, days)
+    days = days + ut1_utc.to_value("day")  # type: ignore
+    era = 2 * np.pi * (0.7790572732640 + 1.00273781191135448 * days)
+    gmst = era + (0.014506 + 4612.156534 * t + 1.3915817 * t**2) * ARCSEC
+    gast = gmst + dpsi * np.cos(eps)
+    ha = gast + lon - ra
+
+    el = np.arcsin(np.sin(lat) * np.sin(dec) + np.cos(lat) * np.cos(dec) * np.cos(ha))
+    az = np.arctan2(
+        -np.cos(dec) * np.sin(ha),
+        np.sin(dec) * np.cos(lat) - np.cos(dec) * np.sin(lat) * np.cos(ha),
+    )
+
+    az = np.rad2deg(az) % 360
+    el = np.rad2deg(el)
+    lst = np.rad2deg(gmst + lon) / 15 % 24
+    return az, el, lst
+
+
+def _compute_many(objects: Sequence[Object], site: Location, time: Time) -> AzEl:
+    """Compute az/el and local sidereal time (LST) of many astronomical objects.
+
+    Similar to ``compute_many`` function, but this function receives instances
+    of ``Object``, ``Location``, and ``Time`` classes as arguments.
+
+    Args:
+        objects: Sequence of object information.
+        site: Site location information.
+        time: Time information.
+
+    Returns:
+        Computed DataFrame of objects' az/el and LST at given site and view.
+        Objects of duplicate names are computed (and included) only once.
+
+    Raises:
+        AzelyError: Raised if no objects are given.
+
+    """
+    unique: dict[str, Object] = {}
+
+    for obj in objects:
+        unique.setdefault(obj.name, obj)
+
+    if not (objects := list(unique.values())):
+        raise AzelyError("At least one object must be given")
+
     obstime = time.to_obstime(site.to_earthlocation())
-    skycoord = object.to_skycoord(obstime)
+    altaz = AltAz(obstime=obstime, location=obstime.location)
 
-    az = skycoord.altaz.az
-    el = skycoord.altaz.alt
+    az = np.empty((len(objects), len(time)))
+    el = np.empty((len(objects), len(time)))
     lst = to_timedelta(obstime.sidereal_time("mean").value, unit="hr")
 
-    azel = AzEl(dict(az=az, el=el, lst=lst), index=time.to_index())
-    azel.object = object
+    for indices, skycoord in _to_skycoords(objects, obstime):
+        transformed = skycoord.transform_to(altaz)
+        az[indices] = transformed.az.deg  # type: ignore
+        el[indices] = transformed.alt.deg  # type: ignore
+
+    azels = [
+        AzEl(dict(az=az_, el=el_, lst=lst), index=time.to_index())
+        for az_, el_ in zip(az, el)
+    ]
+
+    azel = concat(azels, axis=1, keys=[obj.name for obj in objects])
+    azel.object = list(objects)
     azel.site = site
     return azel
+
+
+def _compute_sites(object: Object, sites: Sequence[Location], time: Time) -> AzEl:
+    """Compute az/el and local sidereal time (LST) of an object at many sites.
+
+    Similar to ``compute_sites`` function, but this function receives instances
+    of ``Object``, ``Location``, and ``Time`` classes as arguments.
+
+    Args:
+        object: Object information.
+        sites: Sequence of site location information.
+        time: Time information.
+
+    Returns:
+        Computed DataFrame of object's az/el and LST at given sites and view.
+
+    Raises:
+        AzelyError: Raised if one of mid-level APIs fails to get any information.
+
+    """
+    # (number of sites, 1) x (1, number of time samples)
+    earthloc = _to_earthlocation(sites).reshape(-1, 1)
+    obstime = time.to_obstime().reshape(1, -1)
+    altaz = AltAz(obstime=obstime, location=earthloc)
+
+    if object.is_solar:
+        skycoord = get_body(object.name, obstime)
+    else:
+        skycoord = SkyCoord(*object.values, unit="deg", frame=object.frame)
+
+    transformed = skycoord.transform_to(altaz)
+    az = transformed.az.deg  # type: ignore
+    el = transformed.alt.deg  # type: ignore
+    lst = obstime.sidereal_time("mean", longitude=earthloc.lon).hour  # type: ignore
+
+    azels = [
+        AzEl(
+            dict(az=az_, el=el_, lst=to_timedelta(lst_, unit="hr")),
+            index=time.to_index(),
+        )
+        for az_, el_, lst_ in zip(az, el, lst)
+    ]
+
+    azel = concat(azels, axis=1, keys=[site.name for site in sites])
+    azel.object = object
+    azel.site = list(sites)
+    return azel
+
+
+def _resolve(
+    object: str, site: str, view: str, frame: str, timeout: int
+) -> tuple[Object, Location, tzinfo]:
+    """Resolve object, site, and view concurrently in the resolver threads.
+
+    If view is empty or equal to site, then the timezone of the resolved site
+    is used so that the same location is never resolved twice.
+
+    """
+    object_ = submit(_resolve_object, object, frame, timeout)
+    site_ = submit(_resolve_site, site, not view or view == site, timeout)
+    view_ = submit(_resolve_view, view, timeout) if view and view != site else None
+
+    location, tzinfo_ = site_.result()
+
+    if view_ is not None:
+        tzinfo_ = view_.result()
+
+    return object_.result(), location, tzinfo_  # type: ignore
+
+
+def _resolve_object(object: str, frame: str, timeout: int) -> Object:
+    """Resolve an object in the object stage."""
+    with stage("object"):
+        return get_object(object, frame=frame, timeout=timeout)
+
+
+def _resolve_site(
+    site: str, is_view: bool, timeout: int
+) -> tuple[Location, Optional[tzinfo]]:
+    """Resolve a site (and its timezone if it is also the view) in the stages."""
+    with stage("site"):
+        location = get_location(site, timeout=timeout)
+
+    if not is_view:
+        return location, None
+
+    with stage("view"):
+        return location, location.get_timezone(AZELY_CACHE)
+
+
+def _resolve_view(view: str, timeout: int) -> tzinfo:
+    """Resolve the timezone of a view in the view stage."""
+    with stage("view"):
+        return get_tzinfo(view, timeout)
+
+
+def _same_memory(cached: np.ndarray, data: np.ndarray) -> bool:
+    """Check if two arrays are views of the same memory with the same shape."""
+    return (
+        cached.shape == data.shape
+        and cached.__array_interface__["data"] == data.__array_interface__["data"]
+    )
+
+
+def _to_earthlocation(sites: Sequence[Location]) -> EarthLocation:
+    """Convert sites to an EarthLocation object of the same length."""
+    return EarthLocation.from_geodetic(*np.array([site.values for site in sites]).T)
+
+
+def _to_skycoords(objects: Sequence[Object], obstime: ObsTime) -> Iterator[Any]:
+    """Yield indices of objects and their SkyCoord grouped by frame.
+
+    Non-solar objects in the same frame are packed into one SkyCoord
+    whose shape is (number of objects, 1), which is then broadcast
+    against the time samples by the AltAz transform.
+    Solar objects are yielded one by one with the shape of the time samples.
+
+    """
+    frames: defaultdict[str, list[int]] = defaultdict(list)
+
+    for index, obj in enumerate(objects):
+        if obj.is_solar:
+            yield [index], get_body(obj.name, obstime)
+        else:
+            frames[obj.frame].append(index)
+
+    for frame, indices in frames.items():
+        skycoord = SkyCoord(
+            *np.array([objects[index].values for index in indices]).T,
+            unit="deg",
+            frame=frame,
+        )
+        yield indices, skycoord.reshape(-1, 1)
@@ -0,0 +1,320 @@
+__all__ = [
+    "Backend",
+    "SQLiteBackend",
+    "TOMLBackend",
+    "export_toml",
+    "get_backend",
+    "import_toml",
+]
+
+
+# standard library
+import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
+from json import dumps as json_dumps, loads
+from os import fsync
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock, local
+from typing import Any, Iterable, Iterator, Optional, Protocol, Union
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None  # type: ignore
+
+
+# dependencies
+from tomlkit import TOMLDocument, dumps, load, nl
+from .metrics import metrics
+
+
+# type hints
+PathLike = Union[Path, str]
+Item = dict[str, Any]
+
+
+# constants
+SQLITE_MAX_VARS = 500
+SQLITE_SUFFIXES = ".db", ".sqlite", ".sqlite3"
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    tab TEXT NOT NULL,
+    query TEXT NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (tab, query)
+) WITHOUT ROWID
+"""
+
+
+# global variables
+toml_lock = Lock()
+"""Lock for updating the TOML files."""
+
+
+# backend classes
+class Backend(Protocol):
+    """Storage of cached objects and locations."""
+
+    def get(self, table: str, query: str) -> Optional[Item]:
+        """Return the item of the query in the table (None if not found)."""
+        ...
+
+    def get_many(self, table: str, queries: Iterable[str]) -> dict[str, Item]:
+        """Return the items of the queries found in the table at once."""
+        ...
+
+    def items(self) -> Iterator[tuple[str, str, Item]]:
+        """Yield all (table, query, item) stored in the storage."""
+        ...
+
+    def update(self, table: str, items: dict[str, Item]) -> None:
+        """Add or update the items of the queries in the table at once."""
+        ...
+
+
+class TOMLBackend:
+    """Storage of cached objects and locations in a TOML file."""
+
+    def __init__(self, toml: PathLike) -> None:
+        self.toml = Path(toml)
+
+    def get(self, table: str, query: str) -> Optional[Item]:
+        """Return the item of the query in the table (None if not found)."""
+        tab = load_toml(self.toml).get(table, {})
+
+        if (item := tab.get(query)) is None:
+            return None
+
+        return item.unwrap()
+
+    def get_many(self, table: str, queries: Iterable[str]) -> dict[str, Item]:
+        """Return the items of the queries found in the table at once."""
+        tab = load_toml(self.toml).get(table, {})
+        return {query: tab[query].unwrap() for query in queries if query in tab}
+
+    def items(self) -> Iterator[tuple[str, str, Item]]:
+        """Yield all (table, query, item) stored in the TOML file."""
+        for table, tab in load_toml(self.toml).unwrap().items():
+            if not isinstance(tab, dict):
+                continue
+
+            for query, item in tab.items():
+                if isinstance(item, dict):
+                    yield table, query, item
+
+    def update(self, table: str, items: dict[str, Item]) -> None:
+        """Add or update the items of the queries in the table at once."""
+        with sync_toml(self.toml) as doc:
+            tab = doc.setdefault(table, {})
+
+            for query, item in items.items():
+                tab[query] = item
+
+            if tab is not doc.last_item():
+                tab.add(nl())
+
+        metrics.inc("azely_cache_updates_total", len(items), table=table)
+
+
+class SQLiteBackend:
+    """Storage of cached objects and locations in an SQLite database.
+
+    Items are stored as JSON text indexed by (table, query), and the database
+    is opened in the WAL mode so that readers in many processes never block.
+    Each thread has its own connection to the database.
+
+    """
+
+    def __init__(self, database: PathLike, timeout: float = 10.0) -> None:
+        self.database = Path(database)
+        self.timeout = timeout
+        self.local = local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the database for the current thread."""
+        if (connection := getattr(self.local, "connection", None)) is None:
+            connection = sqlite3.connect(self.database, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(SQLITE_SCHEMA)
+            self.local.connection = connection
+
+        return connection
+
+    def get(self, table: str, query: str) -> Optional[Item]:
+        """Return the item of the query in the table (None if not found)."""
+        row = self.connection.execute(
+            "SELECT item FROM cache WHERE tab = ? AND query = ?",
+            (table, query),
+        ).fetchone()
+
+        return None if row is None else loads(row[0])
+
+    def get_many(self, table: str, queries: Iterable[str]) -> dict[str, Item]:
+        """Return the items of the queries found in the table at once."""
+        queries, items = list(queries), {}
+
+        for start in range(0, len(queries), SQLITE_MAX_VARS):
+            chunk = queries[start : start + SQLITE_MAX_VARS]
+            params = ", ".join("?" * len(chunk))
+
+            for query, item in self.connection.execute(
+                f"SELECT query, item FROM cache WHERE tab = ? AND query IN ({params})",
+                (table, *chunk),
+            ):
+                items[query] = loads(item)
+
+        return items
+
+    def items(self) -> Iterator[tuple[str, str, Item]]:
+        """Yield all (table, query, item) stored in the database."""
+        for table, query, item in self.connection.execute(
+            "SELECT tab, query, item FROM cache ORDER BY tab, query"
+        ):
+            yield table, query, loads(item)
+
+    def update(self, table: str, items: dict[str, Item]) -> None:
+        """Add or update the items of the queries in the table at once."""
+        rows = [(table, query, json_dumps(item)) for query, item in items.items()]
+
+        with self.connection as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO cache (tab, query, item) VALUES (?, ?, ?)",
+                rows,
+            )
+
+        size = sum(len(row[2].encode()) for row in rows)
+        metrics.inc("azely_cache_updates_total", len(rows), table=table)
+        metrics.inc("azely_cache_bytes_written_total", size, backend="sqlite")
+
+
+# main functions
+@lru_cache(maxsize=None)
+def get_backend(source: PathLike) -> Backend:
+    """Return the storage of a cache file selected by its suffix.
+
+    Args:
+        source: Path of the cache file. If its suffix is one of
+            ``.db``, ``.sqlite``, or ``.sqlite3``, then an SQLite database
+            is used. Otherwise, a TOML file is used.
+
+    Returns:
+        Storage of cached objects and locations.
+
+    """
+    if Path(source).suffix in SQLITE_SUFFIXES:
+        return SQLiteBackend(source)
+    else:
+        return TOMLBackend(source)
+
+
+def export_toml(source: PathLike, toml: PathLike) -> None:
+    """Export all cached items of a cache file to a TOML file.
+
+    Args:
+        source: Path of the cache file (e.g., ``'cache.db'``).
+        toml: Path of the TOML file to which the items are added.
+
+    """
+    copy_items(get_backend(source), get_backend(toml))
+
+
+def import_toml(toml: PathLike, source: PathLike) -> None:
+    """Import all cached items of a TOML file to a cache file.
+
+    Args:
+        toml: Path of the TOML file (e.g., ``'cache.toml'``).
+        source: Path of the cache file to which the items are added.
+
+    """
+    copy_items(get_backend(toml), get_backend(source))
+
+
+# helper functions
+def copy_items(src: Backend, dest: Backend) -> None:
+    """Copy all items of a storage to another one (one update per table)."""
+    tables: dict[str, dict[str, Item]] = {}
+
+    for table, query, item in src.items():
+        tables.setdefault(table, {})[query] = item
+
+    for table, items in tables.items():
+        dest.update(table, items)
+
+
+def dump_toml(doc: TOMLDocument, toml: PathLike) -> None:
+    """Write a tomlkit document to a TOML file atomically."""
+    toml = Path(toml)
+
+    with NamedTemporaryFile(
+        "w",
+        dir=toml.parent,
+        prefix=f".{toml.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as file:
+        temp = Path(file.name)
+
+        try:
+            file.write(text := dumps(doc))
+            file.flush()
+            fsync(file.fileno())
+        except BaseException:
+            temp.unlink()
+            raise
+
+    if toml.exists():
+        temp.chmod(toml.stat().st_mode)
+
+    temp.replace(toml)
+    metrics.inc("azely_cache_bytes_written_total", len(text.encode()), backend="toml")
+
+
+def load_toml(toml: PathLike) -> TOMLDocument:
+    """Read a TOML file as a tomlkit document (empty if it does not exist)."""
+    if not Path(toml).exists():
+        return TOMLDocument()
+
+    with open(toml, "r") as file:
+        return load(file)
+
+
+@contextmanager
+def lock_toml(toml: PathLike) -> Iterator[None]:
+    """Hold an advisory lock of a TOML file across processes.
+
+    The lock is taken on a sidecar file (``.<name>.lock``) rather than
+    the TOML file itself, which is replaced (and thus unlocked) when written.
+    It is not taken on platforms without ``fcntl`` (i.e., Windows).
+
+    """
+    if fcntl is None:
+        yield
+        return
+
+    toml = Path(toml)
+
+    with open(toml.parent / f".{toml.name}.lock", "a") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def sync_toml(toml: PathLike) -> Iterator[TOMLDocument]:
+    """Open a TOML file as an updatable tomlkit document.
+
+    The file is read again and written atomically (by a temporary file
+    and rename) while the locks are held, so that it is never seen half written
+    and concurrent updates in the same process or in other processes
+    (by an advisory file lock; except on Windows) are not lost.
+
+    """
+    with toml_lock, lock_toml(toml):
+        yield (doc := load_toml(toml))
+        dump_toml(doc, toml)
@@ -1,4 +1,8 @@
 __all__ = [
+    # config
+    "CONFIG",
+    "Config",
+    "get_config",
     # file-related
     "AZELY_DIR",
     "AZELY_CACHE",
@@ -12,11 +16,14 @@ __all__ = [
     "NOW",
     "TODAY",
     # defaults
+    "CACHE_SIZE",
     "DAYFIRST",
     "FRAME",
     "FREQ",
     "GOOGLE_API",
+    "IERS_TABLE",
     "IPINFO_API",
+    "OFFLINE",
     "SITE",
     "TIME",
     "TIMEOUT",
@@ -26,21 +33,27 @@ __all__ = [
 
 
 # standard library
+from dataclasses import dataclass, fields
 from os import getenv
 from pathlib import Path
-from typing import Any, Optional, TypeVar, overload
+from typing import Any, Optional
 
 
 # dependencies
-from astropy.coordinates import solar_system_ephemeris as solar
 from tomlkit import load
 
 
-# type hints
-T = TypeVar("T")
+# helper functions
+def __getattr__(name: str) -> Any:
+    """Load constants that require heavy dependencies on first access."""
+    if name == "SOLAR_OBJECTS":
+        from astropy.coordinates import solar_system_ephemeris
+
+        return tuple(solar_system_ephemeris.bodies)  # type: ignore
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# helper functions
 def ensure(toml: Path) -> Path:
     """Create an empty TOML file if it does not exist."""
     if not toml.exists():
@@ -50,33 +63,6 @@ def ensure(toml: Path) -> Path:
     return toml
 
 
-@overload
-def getval(toml: Path, keys: str, default: type[T]) -> Optional[T]:
-    ...
-
-
-@overload
-def getval(toml: Path, keys: str, default: T) -> T:
-    ...
-
-
-def getval(toml: Path, keys: str, default: Any) -> Any:
-    """Return the value of the keys in a TOML file."""
-    if isinstance(default, type):
-        type_, default_ = default, None
-    else:
-        type_, default_ = type(default), default
-
-    with open(toml) as file:
-        doc = load(file)
-
-    for key in keys.split("."):
-        if (doc := doc.get(key)) is None:
-            return default_
-
-    return type_(doc.unwrap())
-
-
 # file-related
 if (env := getenv("AZELY_DIR")) is not None:
     AZELY_DIR = Path(env)
@@ -99,8 +85,8 @@ HERE = "here"
 SOLAR_FRAME = "solar"
 """Special frame for objects in the solar system."""
 
-SOLAR_OBJECTS: tuple[str, ...] = tuple(solar.bodies)  # type: ignore
-"""List of objects in the solar system."""
+SOLAR_OBJECTS: tuple[str, ...]
+"""List of objects in the solar system (loaded by astropy on first access)."""
 
 
 # time-related
@@ -111,33 +97,92 @@ TODAY = "today"
 """Special query for getting today's time information."""
 
 
+# config
+@dataclass(frozen=True)
+class Config:
+    """Default values in the ``[defaults]`` table of the config file."""
+
+    cache_size: int = 1024
+    dayfirst: bool = False
+    frame: str = "icrs"
+    freq: str = "10T"
+    google_api: Optional[str] = None
+    iers_table: Optional[str] = None
+    ipinfo_api: Optional[str] = None
+    offline: bool = False
+    site: str = HERE
+    time: str = TODAY
+    timeout: float = 10.0
+    view: Optional[str] = None
+    yearfirst: bool = False
+
+
+def get_config(toml: Path = AZELY_CONFIG) -> Config:
+    """Return the config parsed from a TOML file.
+
+    The defaults of azely's functions (e.g., ``SITE``) are bound to
+    the config parsed once when azely is imported (``CONFIG``),
+    so a changed config takes effect only in a new process.
+
+    """
+    with open(toml) as file:
+        defaults = load(file).get("defaults", {})
+
+    values: dict[str, Any] = {}
+
+    for field in fields(Config):
+        if (value := defaults.get(field.name)) is None:
+            continue
+
+        # tomlkit returns booleans as plain bool (without unwrap)
+        if hasattr(value, "unwrap"):
+            value = value.unwrap()
+
+        type_ = str if field.default is None else type(field.default)
+        values[field.name] = type_(value)
+
+    return Config(**values)
+
+
 # defaults
-DAYFIRST = getval(AZELY_CONFIG, "defaults.dayfirst", False)
+CONFIG = get_config()
+"""Config parsed when azely is imported."""
+
+CACHE_SIZE = CONFIG.cache_size
+"""Default maximum number of objects and locations cached in memory."""
+
+DAYFIRST = CONFIG.dayfirst
 """Default value for the ``dayfirst`` parameter."""
 
-FRAME = getval(AZELY_CONFIG, "defaults.frame", "icrs")
+FRAME = CONFIG.frame
 """Default value for the ``frame`` parameter."""
 
-FREQ = getval(AZELY_CONFIG, "defaults.freq", "10T")
+FREQ = CONFIG.freq
 """Default value for the ``freq`` parameter."""
 
-GOOGLE_API = getval(AZELY_CONFIG, "defaults.google_api", str)
+GOOGLE_API = CONFIG.google_api
 """Default value for the ``google_api`` parameter."""
 
-IPINFO_API = getval(AZELY_CONFIG, "defaults.ipinfo_api", str)
+IERS_TABLE = CONFIG.iers_table
+"""Default value for the ``iers_table`` parameter."""
+
+IPINFO_API = CONFIG.ipinfo_api
 """Default value for the ``ipinfo_api`` parameter."""
 
-SITE = getval(AZELY_CONFIG, "defaults.site", HERE)
+OFFLINE = CONFIG.offline
+"""Whether azely starts in the offline mode."""
+
+SITE = CONFIG.site
 """Default value for the ``site`` parameter."""
 
-TIME = getval(AZELY_CONFIG, "defaults.time", TODAY)
+TIME = CONFIG.time
 """Default value for the ``time`` parameter."""
 
-TIMEOUT = getval(AZELY_CONFIG, "defaults.timeout", 10.0)
+TIMEOUT = CONFIG.timeout
 """Default value for the ``timeout`` parameter."""
 
-VIEW = getval(AZELY_CONFIG, "defaults.view", str)
+VIEW = CONFIG.view
 """Default value for the ``view`` parameter."""
 
-YEARFIRST = getval(AZELY_CONFIG, "defaults.yearfirst", False)
+YEARFIRST = CONFIG.yearfirst
 """Default value for the ``yearfirst`` parameter."""
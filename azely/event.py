@@ -0,0 +1,442 @@
+__all__ = ["events", "visibility"]
+
+
+# standard library
+from collections import defaultdict
+from typing import Callable, Sequence
+
+
+# dependencies
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import AltAz, SkyCoord, get_body
+from astropy.coordinates.erfa_astrom import ErfaAstromInterpolator, erfa_astrom
+from pandas import DataFrame, DatetimeIndex, Timedelta
+from .azel import _to_skycoords
+from .location import Location, get_location
+from .object import Object, get_object
+from .time import Time, get_time
+
+
+# constants
+from .consts import (
+    DAYFIRST,
+    FRAME,
+    FREQ,
+    SITE,
+    TIME,
+    TIMEOUT,
+    VIEW,
+    YEARFIRST,
+)
+
+ASTROM_RESOLUTION = 3600
+CHUNK_SIZE = 1_000_000
+INVPHI = (np.sqrt(5) - 1) / 2
+
+
+# type hints
+Function = Callable[[np.ndarray], np.ndarray]
+
+
+# main functions
+def events(
+    object: str,
+    site: str = SITE,
+    time: str = TIME,
+    view: str = VIEW,
+    el_limit: float = 0.0,
+    precision: str = "1s",
+    frame: str = FRAME,
+    freq: str = FREQ,
+    dayfirst: bool = DAYFIRST,
+    yearfirst: bool = YEARFIRST,
+    timeout: int = TIMEOUT,
+) -> DataFrame:
+    """Find rise, set, and transit times of an astronomical object.
+
+    The ``events`` function (1) computes elevation of an object on time samples
+    of given ``time`` and ``freq`` (as ``compute`` function does), (2) brackets
+    crossings of the elevation limit (rise/set) and local maxima of the elevation
+    (transit) between the time samples, and (3) refines them by vectorized
+    bisection (rise/set) and golden-section search (transit) until ``precision``.
+    Each refinement step evaluates all events by one az/el transform.
+
+    Note that two events within one interval of ``freq`` (e.g., rise and set
+    of an object that grazes the limit) cannot be bracketed and are missed.
+
+    Args:
+        object: Query string for object information (e.g., ``'Sun'`` or ``'NGC1068'``).
+        site: Query string for location information at a site (e.g., ``'Tokyo'``).
+        time: Query string for time information at a view (e.g., ``'2020-01-01'``).
+        view: Query string for timezone information at the view. (e.g., ``'Asia/Tokyo'``,
+            ``'UTC'``, or ``Tokyo``). By default (``''``),  timezone at the site is used.
+        el_limit: Elevation limit (deg) whose crossings are found as rise and set.
+        precision: Precision of the event times as the same format of pandas
+            Timedelta (e.g., ``'1s'`` -> 1 second, ``'100ms'`` -> 0.1 seconds).
+        frame: (object option) Name of equatorial coordinates used in astropy's SkyCoord.
+        freq: (time option) Frequency of time samples to bracket the events.
+        dayfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the day.
+        yearfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the year.
+        timeout: (common option) Query timeout expressed in units of seconds.
+
+    Returns:
+        DataFrame of the events (``'rise'``, ``'set'``, or ``'transit'``)
+        and object's az/el at them indexed by time in view.
+
+    Raises:
+        AzelyError: Raised if one of mid-level APIs fails to get any information.
+
+    Examples:
+        To find rise, set, and transit of the Sun in Tokyo in Jan. 2020::
+
+            >>> df = azely.events('Sun', 'Tokyo', '2020-01-01 to 2020-02-01')
+
+        To find when NGC1068 gets above 30 deg at ALMA AOS::
+
+            >>> df = azely.events('NGC1068', 'ALMA AOS', '2020-02-01', el_limit=30)
+
+    """  # noqa: E501
+    object_ = get_object(object, frame=frame, timeout=timeout)
+    site_ = get_location(site, timeout=timeout)
+    time_ = get_time(time, view or site, freq, dayfirst, yearfirst, timeout)
+
+    return _events(object_, site_, time_, el_limit, precision)
+
+
+def visibility(
+    objects: Sequence[str],
+    site: str = SITE,
+    time: str = TIME,
+    view: str = VIEW,
+    min_el: float = 0.0,
+    max_el: float = 90.0,
+    precision: str = "1s",
+    frame: str = FRAME,
+    freq: str = FREQ,
+    dayfirst: bool = DAYFIRST,
+    yearfirst: bool = YEARFIRST,
+    timeout: int = TIMEOUT,
+) -> DataFrame:
+    """Find time intervals during which astronomical objects are observable.
+
+    The ``visibility`` function (1) computes elevation of objects on coarse
+    time samples of given ``time`` and ``freq`` (objects in the same frame are
+    transformed at once, as ``compute_many`` function does), (2) brackets
+    the boundaries of the elevation range between the time samples, and
+    (3) refines all of them by vectorized bisection until ``precision``.
+    Only boolean visibility is kept on the coarse time samples, so that
+    long periods (e.g., a semester) of many objects can be handled
+    without materializing az/el at fine resolution.
+
+    Note that intervals (or gaps between them) shorter than ``freq``
+    may not be bracketed and are missed.
+
+    Args:
+        objects: Query strings for object information (e.g., ``['Sun', 'NGC1068']``).
+        site: Query string for location information at a site (e.g., ``'Tokyo'``).
+        time: Query string for time information at a view (e.g., ``'2020-01-01'``).
+        view: Query string for timezone information at the view. (e.g., ``'Asia/Tokyo'``,
+            ``'UTC'``, or ``Tokyo``). By default (``''``),  timezone at the site is used.
+        min_el: Lower limit of elevation (deg) at which objects are observable.
+        max_el: Upper limit of elevation (deg) at which objects are observable.
+        precision: Precision of the interval boundaries as the same format of pandas
+            Timedelta (e.g., ``'1s'`` -> 1 second, ``'100ms'`` -> 0.1 seconds).
+        frame: (object option) Name of equatorial coordinates used in astropy's SkyCoord.
+        freq: (time option) Frequency of time samples to bracket the boundaries.
+        dayfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the day.
+        yearfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the year.
+        timeout: (common option) Query timeout expressed in units of seconds.
+
+    Returns:
+        DataFrame of the intervals (one per row) whose columns are object name,
+        start and end time in view. Intervals that continue beyond the period
+        are clipped by the first or last time sample.
+
+    Raises:
+        AzelyError: Raised if one of mid-level APIs fails to get any information.
+
+    Examples:
+        To find when NGC1068 and 3C 273 are above 30 deg at ALMA AOS
+        in the first half of 2020::
+
+            >>> df = azely.visibility(
+                ['NGC1068', '3C 273'],
+                'ALMA AOS',
+                '2020-01-01 to 2020-07-01',
+                min_el=30,
+                freq='1H',
+            )
+
+    """  # noqa: E501
+    objects_ = [get_object(obj, frame=frame, timeout=timeout) for obj in objects]
+    site_ = get_location(site, timeout=timeout)
+    time_ = get_time(time, view or site, freq, dayfirst, yearfirst, timeout)
+
+    return _visibility(objects_, site_, time_, min_el, max_el, precision)
+
+
+# helper functions
+def _events(
+    object: Object,
+    site: Location,
+    time: Time,
+    el_limit: float = 0.0,
+    precision: str = "1s",
+) -> DataFrame:
+    """Find rise, set, and transit times of an astronomical object.
+
+    Similar to ``events`` function, but this function receives instances
+    of ``Object``, ``Location``, and ``Time`` classes as arguments.
+
+    Args:
+        object: Object information.
+        site: Site location information.
+        time: Time information (samples to bracket the events).
+        el_limit: Elevation limit (deg) whose crossings are found as rise and set.
+        precision: Precision of the event times (e.g., ``'1s'``).
+
+    Returns:
+        DataFrame of the events and object's az/el at them indexed by time in view.
+
+    """
+    # time from the first sample (s)
+    start = time.asi8[0]
+    secs = (time.asi8 - start) / 1e9
+    tol = Timedelta(precision).total_seconds()
+
+    def elevation(secs: np.ndarray) -> np.ndarray:
+        return get_azel(object, site, to_index(start, secs))[1]
+
+    el = elevation(secs)
+    above = el >= el_limit
+
+    # rise and set
+    crossing = np.flatnonzero(above[:-1] != above[1:])
+    crossings = bisect(
+        lambda secs: elevation(secs) >= el_limit,
+        secs[crossing],
+        secs[crossing + 1],
+        above[crossing],
+        tol,
+    )
+    kinds = np.where(above[crossing], "set", "rise")
+
+    # transit (local maxima)
+    peak = np.flatnonzero((el[1:-1] > el[:-2]) & (el[1:-1] >= el[2:])) + 1
+    transits = maximize(elevation, secs[peak - 1], secs[peak + 1], tol)
+
+    # az/el at the events
+    secs = np.concatenate([crossings, transits])
+    index = to_index(start, secs).tz_convert(time.tz)
+    az, el = get_azel(object, site, index) if secs.size else (secs, secs)
+
+    data = dict(event=[*kinds, *["transit"] * len(transits)], az=az, el=el)
+    df = DataFrame(data, index=DatetimeIndex(index, name=time.name))
+    return df.sort_index()
+
+
+def _visibility(
+    objects: Sequence[Object],
+    site: Location,
+    time: Time,
+    min_el: float = 0.0,
+    max_el: float = 90.0,
+    precision: str = "1s",
+) -> DataFrame:
+    """Find time intervals during which astronomical objects are observable.
+
+    Similar to ``visibility`` function, but this function receives instances
+    of ``Object``, ``Location``, and ``Time`` classes as arguments.
+
+    Args:
+        objects: Sequence of object information.
+        site: Site location information.
+        time: Time information (samples to bracket the boundaries).
+        min_el: Lower limit of elevation (deg) at which objects are observable.
+        max_el: Upper limit of elevation (deg) at which objects are observable.
+        precision: Precision of the interval boundaries (e.g., ``'1s'``).
+
+    Returns:
+        DataFrame of the intervals whose columns are object name, start and end.
+
+    """
+    # time from the first sample (s)
+    start = time.asi8[0]
+    secs = (time.asi8 - start) / 1e9
+    tol = Timedelta(precision).total_seconds()
+
+    with erfa_astrom.set(ErfaAstromInterpolator(ASTROM_RESOLUTION * u.s)):
+        # (number of objects, number of time samples)
+        el = get_elevations(objects, site, time)
+        inside = (el >= min_el) & (el <= max_el)
+
+        # boundaries of the intervals
+        which, boundary = np.nonzero(inside[:, :-1] != inside[:, 1:])
+        targets = [objects[index] for index in which]
+        el_lo, el_hi = el[which, boundary], el[which, boundary + 1]
+        limit = np.where((el_lo - min_el) * (el_hi - min_el) <= 0, min_el, max_el)
+
+        def func(secs: np.ndarray, indices: np.ndarray) -> np.ndarray:
+            objects_ = [targets[index] for index in indices]
+            return get_elevation(objects_, site, to_index(start, secs)) - limit[indices]
+
+        refined = solve(
+            func,
+            secs[boundary],
+            secs[boundary + 1],
+            el_lo - limit,
+            el_hi - limit,
+            tol,
+        )
+
+    # edges of the intervals (clipped by the period)
+    names: list[str] = []
+    edges: list[np.ndarray] = []
+
+    for index, obj in enumerate(objects):
+        first, last = inside[index, [0, -1]]
+        head = secs[:1] if first else []
+        tail = secs[-1:] if last else []
+
+        edges.append(edge := np.concatenate([head, refined[which == index], tail]))
+        names.extend([obj.name] * (len(edge) // 2))
+
+    index = to_index(start, np.concatenate([[], *edges])).tz_convert(time.tz)
+    return DataFrame(dict(object=names, start=index[::2], end=index[1::2]))
+
+
+def bisect(
+    func: Function,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    f_lo: np.ndarray,
+    tol: float,
+) -> np.ndarray:
+    """Find where a boolean function flips between brackets by bisection."""
+    while lo.size and (hi - lo).max() > tol:
+        mid = (lo + hi) / 2
+        left = func(mid) == f_lo
+        lo, hi = np.where(left, mid, lo), np.where(left, hi, mid)
+
+    return (lo + hi) / 2
+
+
+def solve(
+    func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    lo: np.ndarray,
+    hi: np.ndarray,
+    f_lo: np.ndarray,
+    f_hi: np.ndarray,
+    tol: float,
+) -> np.ndarray:
+    """Find roots of a function between brackets by the Illinois method.
+
+    The function receives the points and the indices of their brackets,
+    and is evaluated only for the brackets that have not converged yet.
+
+    """
+    a, b = np.array(lo, float), np.array(hi, float)
+    f_a, f_b = np.array(f_lo, float), np.array(f_hi, float)
+    active = np.flatnonzero((np.abs(b - a) > tol) & (f_a != 0) & (f_b != 0))
+    b[f_a == 0] = a[f_a == 0]
+
+    while active.size:
+        a_, b_, f_a_, f_b_ = a[active], b[active], f_a[active], f_b[active]
+        c = b_ - f_b_ * (b_ - a_) / (f_b_ - f_a_)
+        f_c = func(c, active)
+
+        flip = f_c * f_b_ < 0
+        a[active] = np.where(flip, b_, a_)
+        f_a[active] = np.where(flip, f_b_, f_a_ / 2)
+        b[active], f_b[active] = c, f_c
+
+        active = active[(np.abs(c - a[active]) > tol) & (f_c != 0)]
+
+    return b
+
+
+def maximize(func: Function, lo: np.ndarray, hi: np.ndarray, tol: float) -> np.ndarray:
+    """Find maxima of a function between brackets by golden-section search."""
+    if not lo.size:
+        return lo
+
+    c, d = hi - (hi - lo) * INVPHI, lo + (hi - lo) * INVPHI
+    f_c, f_d = np.split(func(np.concatenate([c, d])), 2)
+
+    while (hi - lo).max() > tol:
+        left = f_c > f_d
+        lo, hi = np.where(left, lo, c), np.where(left, d, hi)
+
+        new = np.where(left, hi - (hi - lo) * INVPHI, lo + (hi - lo) * INVPHI)
+        f_new = func(new)
+
+        c, d = np.where(left, new, d), np.where(left, c, new)
+        f_c, f_d = np.where(left, f_new, f_d), np.where(left, f_c, f_new)
+
+    return (lo + hi) / 2
+
+
+def get_azel(object: Object, site: Location, index: DatetimeIndex) -> np.ndarray:
+    """Compute az/el (deg) of an object at given time by one transform."""
+    obstime = Time(index).to_obstime(site.to_earthlocation())
+    altaz = object.to_skycoord(obstime).altaz
+    return np.array([altaz.az.deg, altaz.alt.deg])  # type: ignore
+
+
+def get_elevation(
+    objects: Sequence[Object],
+    site: Location,
+    index: DatetimeIndex,
+) -> np.ndarray:
+    """Compute elevation (deg) of objects at given time element by element."""
+    obstime = Time(index).to_obstime(site.to_earthlocation())
+    groups: defaultdict[tuple[bool, str], list[int]] = defaultdict(list)
+    el = np.empty(len(objects))
+
+    for i, obj in enumerate(objects):
+        groups[obj.is_solar, obj.name if obj.is_solar else obj.frame].append(i)
+
+    for (is_solar, key), indices in groups.items():
+        obstime_ = obstime[indices]
+        altaz = AltAz(obstime=obstime_, location=obstime_.location)
+
+        if is_solar:
+            skycoord = get_body(key, obstime_)
+        else:
+            values = np.array([objects[i].values for i in indices]).T
+            skycoord = SkyCoord(*values, unit="deg", frame=key)
+
+        el[indices] = skycoord.transform_to(altaz).alt.deg  # type: ignore
+
+    return el
+
+
+def get_elevations(
+    objects: Sequence[Object],
+    site: Location,
+    time: Time,
+) -> np.ndarray:
+    """Compute elevation (deg) of objects on time samples by chunks of objects."""
+    obstime = time.to_obstime(site.to_earthlocation())
+    altaz = AltAz(obstime=obstime, location=obstime.location)
+    el = np.empty((len(objects), len(time)))
+    step = max(CHUNK_SIZE // max(len(time), 1), 1)
+
+    for chunk in range(0, len(objects), step):
+        objects_ = objects[chunk : chunk + step]
+
+        for indices, skycoord in _to_skycoords(objects_, obstime):
+            transformed = skycoord.transform_to(altaz)
+            el[np.add(indices, chunk)] = transformed.alt.deg  # type: ignore
+
+    return el
+
+
+def to_index(start: int, secs: np.ndarray) -> DatetimeIndex:
+    """Convert time from the start (ns since epoch) to a UTC DatetimeIndex."""
+    return DatetimeIndex(start + np.round(secs * 1e9).astype(np.int64), tz="UTC")
@@ -1,22 +1,36 @@
-__all__ = ["Location", "get_location"]
+__all__ = ["Location", "aget_location", "get_location"]
 
 
 # standard library
 from dataclasses import dataclass
 from datetime import tzinfo
-from functools import partial
-from typing import ClassVar, Optional
+from functools import lru_cache, partial
+from os.path import abspath
+from typing import TYPE_CHECKING, Optional
 
 
 # dependencies
 from astropy.coordinates import EarthLocation, Latitude, Longitude
 from astropy.units import Quantity
-from astropy.utils.data import conf
-from ipinfo import getHandler
 from pytz import timezone
-from timezonefinder import TimezoneFinder
+from .backend import get_backend
 from .consts import AZELY_CACHE, GOOGLE_API, HERE, IPINFO_API, TIMEOUT
-from .utils import PathLike, cache, rename
+from .metrics import measure, metrics
+from .utils import (
+    PathLike,
+    cache,
+    memory,
+    online,
+    record_cache_hit,
+    remote_timeout,
+    rename,
+    run_async,
+)
+
+
+# type hints
+if TYPE_CHECKING:
+    from timezonefinder import TimezoneFinder
 
 
 @dataclass
@@ -35,32 +49,46 @@ class Location:
     altitude: str = "0.0 m"
     """Altitude of the location."""
 
-    tf: ClassVar = TimezoneFinder()
-    """TimezoneFinder instance."""
-
     def __post_init__(self) -> None:
         """Add or update units of location values."""
-        self.longitude = str(Longitude(self.longitude, "deg"))
-        self.latitude = str(Latitude(self.latitude, "deg"))
-        self.altitude = str(Quantity(self.altitude, "m"))
+        self.longitude, self.latitude, self.altitude = normalize_location(
+            str(self.longitude),
+            str(self.latitude),
+            str(self.altitude),
+        )
+
+    @property
+    def values(self) -> tuple[float, float, float]:
+        """Longitude (deg), latitude (deg), and altitude (m) of the location."""
+        return parse_location(self.longitude, self.latitude, self.altitude)
 
     @property
     def timezone(self) -> tzinfo:
-        """Timezone of the location."""
-        response = self.tf.timezone_at(
-            lng=Longitude(self.longitude).value,
-            lat=Latitude(self.latitude).value,
-        )
+        """Timezone of the location (memoized in memory only)."""
+        return self.get_timezone()
 
-        return timezone(str(response))
+    def get_timezone(self, source: Optional[PathLike] = None) -> tzinfo:
+        """Get timezone of the location.
+
+        Args:
+            source: Path of the cache file where the timezone is saved.
+                It should be the one where the location is cached.
+                If not specified, the timezone is memoized in memory only.
+
+        Returns:
+            Timezone of the location.
+
+        """
+        return get_timezone(self.longitude, self.latitude, source)
 
     def to_earthlocation(self) -> EarthLocation:
-        """Convert it to an EarthLocation object."""
-        return EarthLocation(
-            lon=Longitude(self.longitude),
-            lat=Latitude(self.latitude),
-            height=Quantity(self.altitude),
-        )
+        """Convert it to an EarthLocation object.
+
+        The EarthLocation object is memoized for the same location values,
+        so it must not be modified in place.
+
+        """
+        return to_earthlocation(*self.values)
 
 
 def get_location(
@@ -95,8 +123,39 @@ def get_location(
         )
 
 
+async def aget_location(
+    query: str,
+    /,
+    *,
+    google_api: Optional[str] = GOOGLE_API,
+    ipinfo_api: Optional[str] = IPINFO_API,
+    name: Optional[str] = None,
+    source: Optional[PathLike] = AZELY_CACHE,
+    timeout: float = TIMEOUT,
+    update: bool = False,
+) -> Location:
+    """Get location information without blocking the event loop.
+
+    This is the async counterpart of ``get_location``, which is run
+    in the default executor of the running event loop.
+
+    """
+    return await run_async(
+        get_location,
+        query,
+        google_api=google_api,
+        ipinfo_api=ipinfo_api,
+        name=name,
+        source=source,
+        timeout=timeout,
+        update=update,
+    )
+
+
 @partial(rename, key="name")
 @partial(cache, table="location")
+@online
+@partial(measure, resolver="ipinfo")
 def get_location_by_ip(
     query: str,
     /,
@@ -109,6 +168,8 @@ def get_location_by_ip(
     update: bool,  # @cache
 ) -> Location:
     """Get location information by ipinfo.io."""
+    from ipinfo import getHandler
+
     handler = getHandler(ipinfo_api)
     response = handler.getDetails(timeout=timeout)
 
@@ -121,6 +182,8 @@ def get_location_by_ip(
 
 @partial(rename, key="name")
 @partial(cache, table="location")
+@online
+@partial(measure, resolver="map")
 def get_location_by_map(
     query: str,
     /,
@@ -133,7 +196,7 @@ def get_location_by_map(
     update: bool,  # @cache
 ) -> Location:
     """Get location information by online maps."""
-    with conf.set_temp("remote_timeout", timeout):
+    with remote_timeout.set(timeout):
         response = EarthLocation.of_address(
             address=query,
             get_height=bool(google_api),
@@ -145,3 +208,93 @@ def get_location_by_map(
         longitude=str(response.lon),
         latitude=str(response.lat),
     )
+
+
+@lru_cache(maxsize=4096)
+def normalize_location(
+    longitude: str,
+    latitude: str,
+    altitude: str,
+) -> tuple[str, str, str]:
+    """Add or update units of location values (memoized)."""
+    return (
+        str(Longitude(longitude, "deg")),
+        str(Latitude(latitude, "deg")),
+        str(Quantity(altitude, "m")),
+    )
+
+
+@lru_cache(maxsize=4096)
+def parse_location(
+    longitude: str,
+    latitude: str,
+    altitude: str,
+) -> tuple[float, float, float]:
+    """Parse location values to floats in units of deg and m (memoized)."""
+    return (
+        float(Longitude(longitude).deg),  # type: ignore
+        float(Latitude(latitude).deg),  # type: ignore
+        float(Quantity(altitude).to_value("m")),
+    )
+
+
+@lru_cache(maxsize=4096)
+def to_earthlocation(
+    longitude: float, latitude: float, altitude: float
+) -> EarthLocation:
+    """Convert location values to an EarthLocation object (memoized)."""
+    return EarthLocation.from_geodetic(longitude, latitude, altitude)
+
+
+def get_timezone(
+    longitude: str,
+    latitude: str,
+    source: Optional[PathLike] = None,
+) -> tzinfo:
+    """Get timezone at given longitude and latitude.
+
+    Results are cached in memory and saved in the ``timezone`` table of
+    the cache file (if specified), so that the timezone finder (which loads
+    timezone polygons) is constructed only when the coordinates are queried
+    for the first time. Cache hits and misses are recorded in the current
+    stage (e.g., ``'view'`` of ``timings``).
+
+    """
+    query = f"{longitude} {latitude}"
+    key = ("timezone", None if source is None else abspath(source), query)
+
+    if (name := memory.get(key)) is not None:
+        metrics.inc("azely_cache_hits_total", table="timezone", level="memory")
+        record_cache_hit(True)
+        return timezone(name)
+
+    if source is not None:
+        if (item := get_backend(source).get("timezone", query)) is not None:
+            metrics.inc("azely_cache_hits_total", table="timezone", level="file")
+            record_cache_hit(True)
+            memory.set(key, item["name"])
+            return timezone(item["name"])
+
+        metrics.inc("azely_cache_misses_total", table="timezone")
+
+    record_cache_hit(False)
+    name = str(
+        get_timezone_finder().timezone_at(
+            lng=float(Longitude(longitude).wrap_at("180d").deg),  # type: ignore
+            lat=float(Latitude(latitude).deg),  # type: ignore
+        )
+    )
+
+    if source is not None:
+        get_backend(source).update("timezone", {query: {"name": name}})
+
+    memory.set(key, name)
+    return timezone(name)
+
+
+@lru_cache(maxsize=None)
+def get_timezone_finder() -> "TimezoneFinder":
+    """Get a TimezoneFinder instance constructed on first call."""
+    from timezonefinder import TimezoneFinder
+
+    return TimezoneFinder()
@@ -0,0 +1,234 @@
+__all__ = [
+    "Metrics",
+    "get_metrics",
+    "measure",
+    "metrics",
+    "reset_metrics",
+    "to_prometheus",
+]
+
+
+# standard library
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, TypeVar
+
+
+# type hints
+TCallable = TypeVar("TCallable", bound=Callable[..., Any])
+Labels = tuple[tuple[str, str], ...]
+
+
+# constants
+LATENCY_BUCKETS = 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+METRICS = {
+    "azely_cache_hits_total": (
+        "counter",
+        "Number of cache hits (in memory or in the cache file).",
+    ),
+    "azely_cache_misses_total": (
+        "counter",
+        "Number of cache misses.",
+    ),
+    "azely_cache_updates_total": (
+        "counter",
+        "Number of items added or updated in the cache file.",
+    ),
+    "azely_cache_bytes_written_total": (
+        "counter",
+        "Number of bytes written to the cache file.",
+    ),
+    "azely_remote_calls_total": (
+        "counter",
+        "Number of calls of the remote resolvers by outcome.",
+    ),
+    "azely_remote_timeouts_total": (
+        "counter",
+        "Number of calls of the remote resolvers that timed out.",
+    ),
+    "azely_remote_latency_seconds": (
+        "histogram",
+        "Latency of the remote resolvers in units of seconds.",
+    ),
+}
+
+
+class Histogram:
+    """Histogram of observed values in fixed buckets."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a value to the bucket of the smallest upper bound."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def samples(self, name: str, labels: Labels) -> dict[str, float]:
+        """Return cumulative bucket counts, sum, and count as samples."""
+        samples: dict[str, float] = {}
+        bounds = [*map(format_value, self.buckets), "+Inf"]
+        count = 0
+
+        for bound, bucket in zip(bounds, self.counts):
+            count += bucket
+            key = format_sample(f"{name}_bucket", (*labels, ("le", bound)))
+            samples[key] = count
+
+        samples[format_sample(f"{name}_sum", labels)] = self.sum
+        samples[format_sample(f"{name}_count", labels)] = count
+        return samples
+
+
+class Metrics:
+    """Thread-safe registry of process-wide counters and histograms."""
+
+    def __init__(self) -> None:
+        self.counters: dict[tuple[str, Labels], float] = {}
+        self.histograms: dict[tuple[str, Labels], Histogram] = {}
+        self.lock = Lock()
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increase a counter of the labels by a value."""
+        key = name, tuple(sorted(labels.items()))
+
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add a value to a histogram of the labels."""
+        key = name, tuple(sorted(labels.items()))
+
+        with self.lock:
+            if (histogram := self.histograms.get(key)) is None:
+                histogram = self.histograms[key] = Histogram(LATENCY_BUCKETS)
+
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        """Remove all counters and histograms."""
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def families(self) -> dict[str, dict[str, float]]:
+        """Return samples grouped by metric name (sorted by name and labels)."""
+        families: dict[str, dict[str, float]] = {}
+
+        with self.lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                families.setdefault(name, {})[format_sample(name, labels)] = value
+
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                families.setdefault(name, {}).update(histogram.samples(name, labels))
+
+        return dict(sorted(families.items()))
+
+
+metrics = Metrics()
+"""Process-wide metrics of the cache and the remote resolvers."""
+
+
+# main functions
+def get_metrics() -> dict[str, float]:
+    """Return the current metrics as a dictionary.
+
+    Keys are samples in the Prometheus notation, e.g.,
+    ``'azely_cache_hits_total{level="memory",table="object"}'``,
+    and histograms are expanded into ``_bucket``, ``_sum``, and ``_count``.
+
+    Returns:
+        Dictionary of the samples and their values.
+
+    """
+    return {
+        key: value
+        for samples in metrics.families().values()
+        for key, value in samples.items()
+    }
+
+
+def reset_metrics() -> None:
+    """Reset all metrics to zero (e.g., between tests)."""
+    metrics.reset()
+
+
+def to_prometheus() -> str:
+    """Render the current metrics in the Prometheus text format.
+
+    Returns:
+        Text of the metrics to be served at a ``/metrics`` endpoint.
+
+    """
+    lines: list[str] = []
+
+    for name, samples in metrics.families().items():
+        type, help = METRICS.get(name, ("untyped", name))
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} {type}")
+
+        for key, value in samples.items():
+            lines.append(f"{key} {format_value(value)}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def measure(func: TCallable, resolver: str) -> TCallable:
+    """Record calls, latency, and timeouts of a remote resolver."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        outcome, start = "error", perf_counter()
+
+        try:
+            result = func(*args, **kwargs)
+            outcome = "success"
+            return result
+        except Exception as error:
+            outcome = "timeout" if is_timeout(error) else "error"
+            raise
+        finally:
+            latency = perf_counter() - start
+            metrics.observe("azely_remote_latency_seconds", latency, resolver=resolver)
+            metrics.inc("azely_remote_calls_total", resolver=resolver, outcome=outcome)
+
+            if outcome == "timeout":
+                metrics.inc("azely_remote_timeouts_total", resolver=resolver)
+
+    return wrapper  # type: ignore
+
+
+# helper functions
+def format_sample(name: str, labels: Labels) -> str:
+    """Format a sample name with labels in the Prometheus notation."""
+    if not labels:
+        return name
+
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return name + "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def format_value(value: float) -> str:
+    """Format a sample value in the Prometheus notation."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Check if an error (or its causes) is due to a timeout."""
+    while error is not None:
+        if isinstance(error, TimeoutError) or "timed out" in str(error).lower():
+            return True
+
+        if "timeout" in type(error).__name__.lower():
+            return True
+
+        error = error.__cause__ or error.__context__  # type: ignore
+
+    return False
@@ -38,26 +38,30 @@ Examples:
         >>> time = azely.time.get_time('2020-01-01 to 2020-01-05', view='UTC')
 
 """
-__all__ = ["Time", "get_time"]
+__all__ = ["Time", "get_time", "get_time_chunks"]
 
 
 # standard library
+from contextlib import nullcontext
 from datetime import datetime, timedelta, tzinfo
-from functools import partial
-from typing import Callable
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterator, Optional, Union
 
 
 # dependent packages
+import numpy as np
 from astropy.coordinates import EarthLocation
 from astropy.time import Time as ObsTime
 from dateutil.parser import parse
+from erfa import dtf2d
 from pandas import DatetimeIndex, date_range
 from pytz import UnknownTimeZoneError, timezone
-from .utils import AzelyError
+from .utils import AzelyError, stage
 from .location import get_location
 
 # constants
 from .consts import (
+    AZELY_CACHE,
     DAYFIRST,
     HERE,
     NOW,
@@ -67,16 +71,28 @@ from .consts import (
     YEARFIRST,
 )
 
+CHUNK_SIZE = 100_000
 DELIMITER = "to"
+NS_PER_DAY = 86_400_000_000_000
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_MINUTE = 60_000_000_000
+TIME_CACHE_SIZE = 64
 
 
 # data classes
 class Time(DatetimeIndex):
     """Azely's time information class."""
 
-    def to_obstime(self, earthloc: EarthLocation) -> ObsTime:
-        """Convert it to an astropy's time (obstime)."""
-        return ObsTime(self.tz_convert(None), location=earthloc)
+    def to_obstime(self, earthloc: Optional[EarthLocation] = None) -> ObsTime:
+        """Convert it to an astropy's time (obstime).
+
+        The time is converted from int64 nanoseconds since the Unix epoch
+        to two-part Julian dates by vectorized operations (see ``to_jd``),
+        which results in the same obstime as astropy's conversion of each element.
+
+        """
+        jd1, jd2 = to_jd(self.asi8)
+        return ObsTime(jd1, jd2, format="jd", scale="utc", location=earthloc)
 
     def to_index(self) -> DatetimeIndex:
         """Convert it to a pandas DatetimeIndex."""
@@ -91,7 +107,7 @@ class Time(DatetimeIndex):
 # main functions
 def get_time(
     query: str = TODAY,
-    view: str = HERE,
+    view: Union[str, tzinfo] = HERE,
     freq: str = FREQ,
     dayfirst: bool = DAYFIRST,
     yearfirst: bool = YEARFIRST,
@@ -118,6 +134,7 @@ def get_time(
             then time range of today or current time is computed, respectively.
         view: Name of timezone (e.g., ``'Asia/Tokyo'`` or ``'UTC'``) or location
             with which timezone can be identified (e.g., ``'Tokyo'``).
+            An already resolved timezone (tzinfo object) is also accepted.
         freq: Frequency of time samples as the same format of pandas offset aliases
             (e.g., ``'1D'`` -> 1 day, ``'3H'`` -> 3 hours, ``'10T'`` -> 10 minutes).
         dayfirst: Whether to interpret the first value in an ambiguous 3-integer
@@ -160,38 +177,180 @@ def get_time(
     """
     query = query.strip()
 
-    try:
-        tzinfo = timezone(view)
-    except UnknownTimeZoneError:
-        tzinfo = get_location(view, timeout=timeout).timezone
+    with stage("view") if isinstance(view, str) else nullcontext():
+        tzinfo = get_tzinfo(view, timeout)
+
+    with stage("time"):
+        if query.lower() == NOW:
+            return Time(get_time_now(tzinfo))
+
+        if query.lower() == TODAY:
+            # the ISO date must not be parsed as year-day-month even if dayfirst
+            today = datetime.now(tzinfo).date().isoformat()
+            return get_time_grid(today, freq, tzinfo, False, False).copy()
+
+        return get_time_grid(query, freq, tzinfo, dayfirst, yearfirst).copy()
+
+
+def get_time_chunks(
+    query: str = TODAY,
+    view: Union[str, tzinfo] = HERE,
+    freq: str = FREQ,
+    dayfirst: bool = DAYFIRST,
+    yearfirst: bool = YEARFIRST,
+    timeout: int = TIMEOUT,
+    size: int = CHUNK_SIZE,
+) -> Iterator[Time]:
+    """Get time information by chunks of fixed size.
+
+    Similar to ``get_time`` function, but this function yields consecutive
+    chunks of the time range (each of which has at most ``size`` time samples),
+    so that a long time range is never created in memory at once.
+    Concatenating all chunks results in the same time samples as ``get_time``.
+
+    Args:
+        query: Query string (e.g., ``'2020-01-01 to 2030-01-01'``).
+        view: Name of timezone (e.g., ``'Asia/Tokyo'`` or ``'UTC'``) or location
+            with which timezone can be identified (e.g., ``'Tokyo'``).
+            An already resolved timezone (tzinfo object) is also accepted.
+        freq: Frequency of time samples as the same format of pandas offset aliases.
+        dayfirst: Whether to interpret the first value in an ambiguous 3-integer
+            date (e.g., ``'01-02-03'``) as the day.
+        yearfirst: Whether to interpret the first value in an ambiguous 3-integer
+            date (e.g., ``'01-02-03'``) as the year.
+        timeout: Query timeout expressed in units of seconds.
+        size: Maximum number of time samples in a chunk.
+
+    Yields:
+        Time information of each chunk as an instance of ``Time`` class.
+
+    Raises:
+        AzelyError: Raised if the function fails to parse query or timezone.
+
+    Examples:
+        To get time range of ten years in UTC by chunks of 1-minute samples::
+
+            >>> for time in azely.time.get_time_chunks(
+                    '2020-01-01 to 2030-01-01', 'UTC', '1T'
+                ):
+                    ...
+
+    """
+    query = query.strip()
+    tzinfo = get_tzinfo(view, timeout)
 
     if query.lower() == NOW:
-        return Time(get_time_now(tzinfo))
-    elif query.lower() == TODAY:
-        return Time(get_time_today(freq, tzinfo))
+        yield Time(get_time_now(tzinfo))
+        return
+
+    if query.lower() == TODAY:
+        start = datetime.now(tzinfo).date()
+        end = start + timedelta(days=1)
     else:
-        parser = partial(parse, dayfirst=dayfirst, yearfirst=yearfirst)
-        return Time(get_time_period(query, freq, tzinfo, parser))
+        parser = partial(parse_time, dayfirst=dayfirst, yearfirst=yearfirst)
+        start, end = parse_period(query, parser)
+
+    for index in get_time_range_chunks(start, end, freq, tzinfo, size):
+        yield Time(index)
 
 
 # helper functions
+def get_tzinfo(view: Union[str, tzinfo], timeout: int) -> tzinfo:
+    """Get timezone by its name or by location (or as is if resolved)."""
+    if isinstance(view, tzinfo):
+        return view
+
+    try:
+        return timezone(view)
+    except UnknownTimeZoneError:
+        # the location is cached in the default cache file, and so is the timezone
+        return get_location(view, timeout=timeout).get_timezone(AZELY_CACHE)
+
+
+@lru_cache(maxsize=TIME_CACHE_SIZE)
+def get_time_grid(
+    query: str, freq: str, tzinfo: tzinfo, dayfirst: bool, yearfirst: bool
+) -> Time:
+    """Get time range of given date and length at given timezone (memoized).
+
+    Queries of today are memoized as queries of the date of today
+    (e.g., ``'2020-01-01'``) so that they are never outdated.
+    Since the grids are shared, they must be copied before returned to users.
+
+    """
+    parser = partial(parse_time, dayfirst=dayfirst, yearfirst=yearfirst)
+    return Time(get_time_period(query, freq, tzinfo, parser))
+
+
 def get_time_now(tzinfo: tzinfo) -> DatetimeIndex:
     """Get current time at given timezone."""
     start = end = datetime.now(tzinfo)
     return date_range(start, end, tz=tzinfo, name=tzinfo.zone)
 
 
-def get_time_today(freq: str, tzinfo: tzinfo) -> DatetimeIndex:
-    """Get time range of today at given timezone."""
-    start = datetime.now(tzinfo).date()
-    end = start + timedelta(days=1)
-    return date_range(start, end, None, freq, tz=tzinfo, name=tzinfo.zone)
-
-
 def get_time_period(
     query: str, freq: str, tzinfo: tzinfo, parser: Callable
 ) -> DatetimeIndex:
     """Get time range of given date and length at given timezone."""
+    start, end = parse_period(query, parser)
+    return date_range(start, end, None, freq, tz=tzinfo, name=tzinfo.zone)
+
+
+def get_time_range_chunks(
+    start: Any, end: Any, freq: str, tzinfo: tzinfo, size: int
+) -> Iterator[DatetimeIndex]:
+    """Get time range of given start and end at given timezone by chunks."""
+    end = date_range(end, periods=1, tz=tzinfo)[0]
+
+    while True:
+        index = date_range(start, None, size + 1, freq, tz=tzinfo, name=tzinfo.zone)
+        chunk, start = index[:size], index[size]
+        yield chunk[chunk <= end]
+
+        if start > end:
+            return
+
+
+def to_jd(ns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert nanoseconds since the Unix epoch to two-part Julian dates (UTC).
+
+    Calendar date and time of day are computed by NumPy and passed to ERFA,
+    so that days with leap seconds are treated in the same way as astropy.
+
+    """
+    days, ns = np.divmod(ns, NS_PER_DAY)
+    hours, ns = np.divmod(ns, NS_PER_HOUR)
+    minutes, ns = np.divmod(ns, NS_PER_MINUTE)
+
+    day = days.astype("M8[D]")
+    month = day.astype("M8[M]")
+    year = month.astype("M8[Y]")
+
+    return dtf2d(
+        "UTC",
+        year.astype(np.int64) + 1970,
+        (month - year).astype(np.int64) + 1,
+        (day - month).astype(np.int64) + 1,
+        hours,
+        minutes,
+        ns / 1e9,
+    )
+
+
+def parse_time(string: str, dayfirst: bool, yearfirst: bool) -> datetime:
+    """Parse date and time (by the fast ISO 8601 parser if possible)."""
+    # dateutil interprets even ISO 8601 dates as year-day-month if dayfirst
+    if not dayfirst:
+        try:
+            return datetime.fromisoformat(string.strip())
+        except ValueError:
+            pass
+
+    return parse(string, dayfirst=dayfirst, yearfirst=yearfirst)
+
+
+def parse_period(query: str, parser: Callable) -> tuple[datetime, datetime]:
+    """Parse start and end of given date and length."""
     period = query.split(DELIMITER)
 
     try:
@@ -203,4 +362,4 @@ def get_time_period(
     except ValueError:
         raise AzelyError(f"Failed to parse: {query}")
 
-    return date_range(start, end, None, freq, tz=tzinfo, name=tzinfo.zone)
+    return start, end
@@ -1,32 +1,192 @@
-__all__ = ["AzelyError", "cache", "rename"]
+__all__ = [
+    "AzelyError",
+    "Timing",
+    "cache",
+    "clear_cache",
+    "online",
+    "rename",
+    "run_async",
+    "set_cache_size",
+    "set_executor",
+    "set_offline",
+    "stage",
+    "timings",
+]
 
 
 # standard library
-from contextlib import contextmanager
-from dataclasses import asdict, replace
-from functools import wraps
+from asyncio import get_running_loop
+from atexit import register
+from collections import OrderedDict
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar, copy_context
+from copy import copy
+from dataclasses import asdict, dataclass, replace
+from functools import partial, wraps
 from inspect import Signature
-from pathlib import Path
-from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+from os.path import abspath
+from threading import Event, Lock
+from time import perf_counter
+from typing import Any, Callable, Hashable, Iterator, Optional, TypeVar
 
 
 # dependencies
-from tomlkit import TOMLDocument, dump, load, nl
+from .backend import PathLike, get_backend
+from .consts import CACHE_SIZE, IERS_TABLE, OFFLINE
+from .metrics import metrics
 
 
 # type hints
-PathLike = Union[Path, str]
+T = TypeVar("T")
 TCallable = TypeVar("TCallable", bound=Callable[..., Any])
 
 
+# constants
+RESOLVER_WORKERS = 8
+UNCACHED_ARGS = "query", "name", "source", "timeout", "update"
+
+
 class AzelyError(Exception):
     """Azely's base exception class."""
 
     pass
 
 
+@dataclass(frozen=True)
+class Timing:
+    """Wall time of a stage of computation."""
+
+    stage: str
+    """Name of the stage (e.g., ``'object'`` or ``'transform'``)."""
+
+    seconds: float
+    """Wall time of the stage in units of seconds."""
+
+    cache_hit: Optional[bool] = None
+    """Whether the cache was hit in the stage (None if not cached)."""
+
+
+class MemoryCache:
+    """Thread-safe in-memory LRU cache of dataclass objects."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.items: OrderedDict[Hashable, Any] = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the cached object (None if not cached)."""
+        with self.lock:
+            if (item := self.items.get(key)) is None:
+                return None
+
+            self.items.move_to_end(key)
+            return copy(item)
+
+    def set(self, key: Hashable, item: Any) -> None:
+        """Cache a copy of the object and evict the least recently used ones."""
+        with self.lock:
+            self.items[key] = copy(item)
+            self.items.move_to_end(key)
+            self.evict()
+
+    def clear(self, table: Optional[str] = None, query: Optional[str] = None) -> None:
+        """Remove the cached objects that match the table and query."""
+        with self.lock:
+            for key in list(self.items):
+                if table is not None and key[0] != table:
+                    continue
+
+                if query is not None and key[2] != query:
+                    continue
+
+                del self.items[key]
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of cached objects."""
+        with self.lock:
+            self.maxsize = maxsize
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used objects over the maximum number."""
+        while len(self.items) > max(self.maxsize, 0):
+            self.items.popitem(last=False)
+
+
+class RemoteTimeout:
+    """Thread-safe setting of astropy's remote timeout shared by resolvers.
+
+    Astropy's config is process-wide and its ``set_temp`` is not thread-safe,
+    so concurrent resolvers share one setting: the longest of their timeouts
+    is set while any of them runs, and the original value is restored
+    when all of them end.
+
+    """
+
+    def __init__(self) -> None:
+        self.timeouts: list[float] = []
+        self.original: Optional[float] = None
+        self.lock = Lock()
+
+    @contextmanager
+    def set(self, timeout: float) -> Iterator[None]:
+        """Set the timeout (in units of seconds) in the context."""
+        from astropy.utils.data import conf
+
+        with self.lock:
+            if not self.timeouts:
+                self.original = conf.remote_timeout
+
+            self.timeouts.append(timeout)
+            conf.remote_timeout = max(self.timeouts)
+
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.timeouts.remove(timeout)
+                conf.remote_timeout = max(self.timeouts, default=self.original)
+
+
+memory = MemoryCache(CACHE_SIZE)
+"""In-memory LRU cache in front of the cache files."""
+
+remote_timeout = RemoteTimeout()
+"""Astropy's remote timeout set while remote resolvers are running."""
+
+offline_mode = Event()
+"""Event set while azely is in the offline mode."""
+
+offline_settings = ExitStack()
+"""Astropy's settings changed in the offline mode (restored when closed)."""
+
+# restore the settings before astropy is torn down at exit
+register(offline_settings.close)
+
+timing_callback: ContextVar[Optional[Callable[[Timing], Any]]]
+timing_callback = ContextVar("timing_callback", default=None)
+"""Function called with the timing of each stage (None if disabled)."""
+
+resolvers = ThreadPoolExecutor(RESOLVER_WORKERS, "azely-resolver")
+"""Threads in which objects, locations, and timezones are resolved concurrently."""
+
+compute_executor: Optional[Executor] = None
+"""Executor of CPU-heavy computation in async functions (None if default)."""
+
+cache_hits: ContextVar[Optional[list[bool]]]
+cache_hits = ContextVar("cache_hits", default=None)
+"""Cache hits (True) or misses (False) in the current stage."""
+
+
 def cache(func: TCallable, table: str) -> TCallable:
-    """Cache a dataclass object in a TOML file."""
+    """Cache a dataclass object in memory and in a cache file (TOML or SQLite)."""
     DataClass = func.__annotations__["return"]
     signature = Signature.from_callable(func)
 
@@ -39,19 +199,55 @@ def cache(func: TCallable, table: str) -> TCallable:
         if (source := bargs["source"]) is None:
             return func(*args, **kwargs)
 
-        with sync_toml(source) as doc:
-            tab = doc.setdefault(table, {})
+        query = bargs["query"]
+        options = (v for k, v in bargs.items() if k not in UNCACHED_ARGS)
+        key = (table, abspath(source), query, *options)
 
-            if (query := bargs["query"]) in tab:
-                if not bargs["update"]:
-                    return DataClass(**tab[query].unwrap())
+        if not bargs["update"] and (item := memory.get(key)) is not None:
+            metrics.inc("azely_cache_hits_total", table=table, level="memory")
+            record_cache_hit(True)
+            return item
 
-            tab[query] = asdict(func(*args, **kwargs))
+        backend = get_backend(source)
 
-            if tab is not doc.last_item():
-                tab.add(nl())
+        if not bargs["update"] and (data := backend.get(table, query)) is not None:
+            metrics.inc("azely_cache_hits_total", table=table, level="file")
+            record_cache_hit(True)
+            item = DataClass(**data)
+        else:
+            metrics.inc("azely_cache_misses_total", table=table)
+            record_cache_hit(False)
+            item = func(*args, **kwargs)
+            backend.update(table, {query: asdict(item)})
+
+        memory.set(key, item)
+        return item
+
+    return wrapper  # type: ignore
+
+
+def clear_cache(table: Optional[str] = None, query: Optional[str] = None) -> None:
+    """Clear objects and locations cached in memory.
+
+    Args:
+        table: Name of the table to be cleared (e.g., ``'object'``).
+            If not specified, objects of all tables are cleared.
+        query: Query of the objects to be cleared (e.g., ``'NGC1068'``).
+            If not specified, objects of all queries are cleared.
+
+    """
+    memory.clear(table, query)
+
+
+def online(func: TCallable) -> TCallable:
+    """Raise AzelyError immediately instead of accessing network in the offline mode."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if offline_mode.is_set():
+            raise AzelyError(f"Failed to get {args[0]!r} in the offline mode")
 
-            return DataClass(**tab[query].unwrap())
+        return func(*args, **kwargs)
 
     return wrapper  # type: ignore
 
@@ -74,11 +270,183 @@ def rename(func: TCallable, key: str) -> TCallable:
     return wrapper  # type: ignore
 
 
+def record_cache_hit(hit: bool) -> None:
+    """Record a cache hit or miss in the current stage (if timings are enabled)."""
+    if (hits := cache_hits.get()) is not None:
+        hits.append(hit)
+
+
+async def run_async(
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    executor: Optional[Executor] = None,
+    **kwargs: Any,
+) -> T:
+    """Run a function in an executor without blocking the event loop.
+
+    Context variables (e.g., those of ``timings``) of the caller
+    are copied to the executor so that the function sees them.
+    They are not copied to a process pool, which cannot pickle them,
+    and thus the function and its arguments must be picklable.
+
+    Args:
+        func: Function to be run in the executor.
+        args: Positional arguments of the function.
+        executor: Executor in which the function is run.
+            If not specified, the default executor of the event loop is used.
+        kwargs: Keyword arguments of the function.
+
+    Returns:
+        Return value of the function.
+
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        call = partial(func, *args, **kwargs)
+    else:
+        call = partial(copy_context().run, func, *args, **kwargs)
+
+    return await get_running_loop().run_in_executor(executor, call)
+
+
+def set_cache_size(size: int) -> None:
+    """Set the maximum number of objects and locations cached in memory.
+
+    Args:
+        size: Maximum number of cached objects. Zero disables the cache.
+
+    """
+    memory.resize(size)
+
+
+def set_executor(executor: Optional[Executor]) -> None:
+    """Set the executor of CPU-heavy computation in async functions.
+
+    The az/el transform of ``acompute`` is offloaded to the executor,
+    while remote resolution runs in the default executor of the event loop.
+
+    Args:
+        executor: Executor of the computation (e.g., a ThreadPoolExecutor
+            or a ProcessPoolExecutor with as many workers as CPU cores).
+            If None, the default executor of the event loop is used.
+
+    """
+    global compute_executor
+    compute_executor = executor
+
+
+def set_offline(
+    offline: bool = True,
+    iers_table: Optional[PathLike] = IERS_TABLE,
+) -> None:
+    """Switch the offline mode of azely.
+
+    In the offline mode, object and location information is obtained
+    only from memory or the cache files, and AzelyError is raised immediately
+    if it is not cached (instead of accessing network until timeout).
+    Astropy is also prevented from downloading any files, and its IERS table
+    is pinned to a local one (the IERS-B table bundled with astropy by default).
+    Time outside the table is then computed with degraded accuracy (with warning).
+
+    Args:
+        offline: Whether to enable or disable the offline mode.
+            If disabled, astropy's settings before enabled are restored.
+        iers_table: Path of a local IERS-A table (e.g., ``'finals2000A.all'``)
+            used in the offline mode instead of the bundled IERS-B table.
+
+    """
+    from astropy.utils import iers
+    from astropy.utils.data import conf
+
+    offline_settings.close()
+
+    if not offline:
+        offline_mode.clear()
+        return
+
+    offline_settings.enter_context(conf.set_temp("allow_internet", False))
+    offline_settings.enter_context(iers.conf.set_temp("auto_download", False))
+    offline_settings.enter_context(iers.conf.set_temp("iers_degraded_accuracy", "warn"))
+
+    if iers_table is not None:
+        table = iers.IERS_A.open(str(iers_table))
+        offline_settings.enter_context(iers.earth_orientation_table.set(table))
+
+    offline_mode.set()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Measure wall time of a stage of computation if timings are enabled.
+
+    Args:
+        name: Name of the stage (e.g., ``'object'`` or ``'transform'``).
+
+    """
+    if (callback := timing_callback.get()) is None:
+        yield
+        return
+
+    token = cache_hits.set(hits := [])
+    start = perf_counter()
+
+    try:
+        yield
+    finally:
+        seconds = perf_counter() - start
+        cache_hits.reset(token)
+        callback(Timing(name, seconds, all(hits) if hits else None))
+
+
+def submit(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> "Future[T]":
+    """Run a function in the resolver threads with a copy of the current context."""
+    return resolvers.submit(copy_context().run, func, *args, **kwargs)
+
+
 @contextmanager
-def sync_toml(toml: PathLike) -> Iterator[TOMLDocument]:
-    """Open a TOML file as an updatable tomlkit document."""
-    with open(toml, "r") as file:
-        yield (doc := load(file))
+def timings(
+    callback: Optional[Callable[[Timing], Any]] = None
+) -> Iterator[list[Timing]]:
+    """Record wall time of each stage of computation in the context.
+
+    The stages of ``compute`` function are object resolution (``'object'``),
+    site resolution (``'site'``), view/timezone resolution (``'view'``),
+    time-grid construction (``'time'``), obstime creation (``'obstime'``),
+    az/el transform (``'transform'``), sidereal time (``'sidereal_time'``),
+    and DataFrame assembly (``'dataframe'``). Each of them is tagged
+    with whether the cache (in memory or in the cache file) was hit.
+    Note that the first three stages run concurrently and may overlap.
+
+    Args:
+        callback: Function called with the timing of each stage
+            (e.g., for logging) just after the stage ends.
+
+    Yields:
+        List to which timings of the stages are appended.
+
+    Examples:
+        To find the slowest stage of a computation::
+
+            >>> with azely.utils.timings() as records:
+                    df = azely.compute('NGC1068', 'ALMA AOS', '2020-02-01')
+            >>> max(records, key=lambda record: record.seconds)
+
+    """
+    records: list[Timing] = []
+
+    def record(timing: Timing) -> None:
+        records.append(timing)
+
+        if callback is not None:
+            callback(timing)
+
+    token = timing_callback.set(record)
+
+    try:
+        yield records
+    finally:
+        timing_callback.reset(token)
+
 
-    with open(toml, "w") as file:
-        dump(doc, file)
+if OFFLINE:
+    set_offline()
@@ -0,0 +1,6 @@
+# dependencies
+from azely.utils import set_offline
+
+
+# benchmarks run without network access
+set_offline()
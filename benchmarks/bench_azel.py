@@ -0,0 +1,124 @@
+# standard library
+from typing import Optional
+
+
+# dependencies
+import numpy as np
+from azely.azel import _compute
+from azely.location import Location
+from azely.object import Object
+from azely.time import get_time
+
+
+# constants
+OBJECT = Object(
+    name="3C 273",
+    longitude="12h29m06.69982572s",
+    latitude="2d03m08.59762998s",
+    frame="icrs",
+)
+MOON = Object(
+    name="Moon",
+    longitude="NA",
+    latitude="NA",
+    frame="solar",
+)
+SITE = Location(
+    name="Atacama Large Millimeter/submillimeter Array",
+    longitude="292d14m48.93972s",
+    latitude="-23d01m21.97704s",
+    altitude="0.0 m",
+)
+
+
+# benchmarks
+class Engine:
+    """Benchmark az/el computation of a month at 1-minute resolution."""
+
+    params = ["astropy", "fast"]
+    param_names = ["engine"]
+
+    def setup(self, engine: str) -> None:
+        self.time = get_time("2020-01-01 to 2020-01-31", "UTC", "1T")
+
+    def time_compute(self, engine: str) -> None:
+        _compute(OBJECT, SITE, self.time, engine)
+
+    def track_error(self, engine: str) -> float:
+        """Maximum angular error (arcsec) against the astropy engine.
+
+        A day of 2005-06-01 (UT1-UTC of about 0.6 s) is also included.
+
+        """
+        errors = []
+
+        for time in (self.time, get_time("2005-06-01", "UTC", "1T")):
+            result = _compute(OBJECT, SITE, time, engine)
+            expected = _compute(OBJECT, SITE, time, "astropy")
+
+            el, el_ = np.deg2rad(result.el), np.deg2rad(expected.el)
+            daz = np.deg2rad(result.az - expected.az)
+            hav = (
+                np.sin((el - el_) / 2) ** 2
+                + np.cos(el) * np.cos(el_) * np.sin(daz / 2) ** 2
+            )
+            errors.append(np.rad2deg(2 * np.arcsin(np.sqrt(hav))).max() * 3600)
+
+        return float(max(errors))
+
+    track_error.unit = "arcsec"  # type: ignore
+
+
+class Ephemeris:
+    """Benchmark az/el computation of a solar object for a week at 1-minute."""
+
+    params = [None, 0.1, 1.0]
+    param_names = ["tolerance"]
+
+    def setup(self, tolerance: Optional[float]) -> None:
+        self.time = get_time("2020-01-01 to 2020-01-08", "UTC", "1T")
+
+    def time_compute(self, tolerance: Optional[float]) -> None:
+        _compute(MOON, SITE, self.time, tolerance=tolerance)
+
+    def track_error(self, tolerance: Optional[float]) -> float:
+        """Maximum ephemeris error (arcsec) reported by the interpolation."""
+        result = _compute(MOON, SITE, self.time, tolerance=tolerance)
+        return result.attrs.get("ephemeris_error", 0.0)
+
+    track_error.unit = "arcsec"  # type: ignore
+
+
+class Samples:
+    """Benchmark az/el computation across sizes of time samples."""
+
+    params = [[100, 10_000, 1_000_000], ["astropy", "fast"]]
+    param_names = ["samples", "engine"]
+    timeout = 600
+
+    def setup(self, samples: int, engine: str) -> None:
+        self.time = get_time("2020-01-01 to 2022-01-01", "UTC", "1T")[:samples]
+
+    def time_compute(self, samples: int, engine: str) -> None:
+        _compute(OBJECT, SITE, self.time, engine)
+
+    def peakmem_compute(self, samples: int, engine: str) -> None:
+        _compute(OBJECT, SITE, self.time, engine)
+
+
+class Views:
+    """Benchmark conversion of time index of computed az/el to LST."""
+
+    params = [10_000, 1_000_000]
+    param_names = ["samples"]
+
+    def setup(self, samples: int) -> None:
+        time = get_time("2020-01-01 to 2022-01-01", "UTC", "1T")[:samples]
+        self.azel = _compute(OBJECT, SITE, time, "fast")
+
+    def time_in_lst(self, samples: int) -> None:
+        # a shallow copy does not have the cached LST index
+        self.azel.copy(deep=False).in_lst
+
+    def time_in_lst_cached(self, samples: int) -> None:
+        self.azel.in_lst
@@ -0,0 +1,79 @@
+# dependencies
+from azely.backend import get_backend
+from azely.location import get_location
+from azely.object import get_object
+from azely.utils import clear_cache
+
+
+# constants
+TOML_MAX_ENTRIES = 10_000
+
+
+# helper functions
+def get_items(table: str, entries: int) -> dict[str, dict[str, str]]:
+    """Create items of objects or locations of a cache file."""
+    items = {}
+
+    for index in range(entries):
+        item = items[f"{table} {index}"] = dict(
+            name=f"{table} {index}",
+            longitude=f"{index % 360}d",
+            latitude=f"{index % 90}d",
+        )
+
+        if table == "object":
+            item["frame"] = "icrs"
+        else:
+            item["altitude"] = "0.0 m"
+
+    return items
+
+
+# benchmarks
+class CacheHit:
+    """Benchmark getting an object or a location from a cache file.
+
+    Note that the TOML cache files of more than 10k entries are skipped
+    since a file hit of them (parsing the whole file) takes minutes.
+
+    """
+
+    params = [[10, 1_000, 10_000, 100_000], [".toml", ".db"]]
+    param_names = ["entries", "suffix"]
+    timeout = 600
+
+    def setup_cache(self) -> None:
+        for entries in self.params[0]:
+            for suffix in self.params[1]:
+                if suffix == ".toml" and entries > TOML_MAX_ENTRIES:
+                    continue
+
+                backend = get_backend(f"cache-{entries}{suffix}")
+                backend.update("object", get_items("object", entries))
+                backend.update("location", get_items("location", entries))
+
+    def setup(self, entries: int, suffix: str) -> None:
+        if suffix == ".toml" and entries > TOML_MAX_ENTRIES:
+            raise NotImplementedError("Too many entries for a TOML file")
+
+        self.source = f"cache-{entries}{suffix}"
+        self.object = f"object {entries // 2}"
+        self.location = f"location {entries // 2}"
+
+        # fill the in-memory cache
+        get_object(self.object, source=self.source)
+        get_location(self.location, source=self.source)
+
+    def time_get_object_in_memory(self, entries: int, suffix: str) -> None:
+        get_object(self.object, source=self.source)
+
+    def time_get_object_in_file(self, entries: int, suffix: str) -> None:
+        clear_cache()
+        get_object(self.object, source=self.source)
+
+    def time_get_location_in_memory(self, entries: int, suffix: str) -> None:
+        get_location(self.location, source=self.source)
+
+    def time_get_location_in_file(self, entries: int, suffix: str) -> None:
+        clear_cache()
+        get_location(self.location, source=self.source)
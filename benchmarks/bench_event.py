@@ -0,0 +1,38 @@
+# dependencies
+from azely.event import _visibility
+from azely.location import Location
+from azely.object import Object
+from azely.time import get_time
+
+
+# constants
+OBJECTS = [
+    Object(
+        name=f"Target {index}",
+        longitude=f"{index * 3.6}d",
+        latitude=f"{index % 90 - 60}d",
+        frame="icrs",
+    )
+    for index in range(100)
+]
+SITE = Location(
+    name="Atacama Large Millimeter/submillimeter Array",
+    longitude="292d14m48.93972s",
+    latitude="-23d01m21.97704s",
+    altitude="0.0 m",
+)
+
+
+# benchmarks
+class Visibility:
+    """Benchmark visibility windows of many objects over a semester."""
+
+    params = [10, 100]
+    param_names = ["objects"]
+    timeout = 300
+
+    def setup(self, objects: int) -> None:
+        self.time = get_time("2020-01-01 to 2020-07-01", "UTC", "1H")
+
+    def time_visibility(self, objects: int) -> None:
+        _visibility(OBJECTS[:objects], SITE, self.time, min_el=30.0)
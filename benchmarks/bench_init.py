@@ -0,0 +1,9 @@
+# benchmarks
+def timeraw_import_azely() -> str:
+    """Benchmark cold import of azely in a new process."""
+    return "import azely"
+
+
+def timeraw_import_compute() -> str:
+    """Benchmark cold import of azely and its compute function."""
+    return "from azely import compute"
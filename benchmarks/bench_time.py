@@ -0,0 +1,35 @@
+# dependencies
+from astropy.time import Time as ObsTime
+from azely.time import get_time, get_time_grid, parse_time
+
+
+# benchmarks
+class GetTime:
+    """Benchmark getting time information by queries."""
+
+    params = ["2020-01-01 to 2020-01-07", "Jan. 1st 2020 to Jan. 7th 2020"]
+    param_names = ["query"]
+
+    def time_get_time(self, query: str) -> None:
+        get_time_grid.cache_clear()
+        get_time(query, "UTC", "10T")
+
+    def time_get_time_cached(self, query: str) -> None:
+        get_time(query, "UTC", "10T")
+
+    def time_parse_time(self, query: str) -> None:
+        parse_time(query.split("to")[0], False, False)
+
+
+class ToObstime:
+    """Benchmark conversion of 1e6 time samples to astropy's time."""
+
+    def setup(self) -> None:
+        self.time = get_time("2020-01-01 to 2022-01-01", "UTC", "1T")[:1_000_000]
+
+    def time_to_obstime(self) -> None:
+        self.time.to_obstime()
+
+    def time_to_obstime_by_astropy(self) -> None:
+        """Reference: astropy's conversion of each element."""
+        ObsTime(self.time.tz_convert(None))
@@ -0,0 +1,67 @@
+# standard library
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+# dependencies
+from azely.backend import export_toml, get_backend, import_toml
+from azely.object import get_object
+from pytest import mark
+
+
+# test data
+items = {
+    "3C 273": {
+        "name": "3C 273",
+        "longitude": "12h29m06.69982572s",
+        "latitude": "2d03m08.59762998s",
+        "frame": "icrs",
+    },
+    "3C 345": {
+        "name": "3C 345",
+        "longitude": "16h42m58.80997043s",
+        "latitude": "39d48m36.9939552s",
+        "frame": "icrs",
+    },
+}
+
+
+# test functions
+@mark.parametrize("suffix", [".toml", ".db"])
+def test_backend(suffix: str) -> None:
+    with TemporaryDirectory() as dir:
+        backend = get_backend(Path(dir) / f"cache{suffix}")
+        backend.update("object", items)
+
+        assert backend.get("object", "3C 273") == items["3C 273"]
+        assert backend.get("object", "3C 279") is None
+        assert list(backend.items()) == [("object", q, i) for q, i in items.items()]
+
+
+def test_import_export() -> None:
+    with TemporaryDirectory() as dir:
+        get_backend(toml := Path(dir) / "cache.toml").update("object", items)
+        import_toml(toml, db := Path(dir) / "cache.db")
+        export_toml(db, toml_ := Path(dir) / "exported.toml")
+
+        assert get_object("3C 273", source=db).name == "3C 273"
+        assert list(get_backend(toml_).items()) == list(get_backend(toml).items())
+
+
+def update_toml(toml: Path, worker: int) -> None:
+    for i in range(10):
+        item = {**items["3C 273"], "name": f"{worker}-{i}"}
+        get_backend(toml).update("object", {f"{worker}-{i}": item})
+
+
+def test_toml_processes() -> None:
+    with TemporaryDirectory() as dir:
+        toml = Path(dir) / "cache.toml"
+
+        with ProcessPoolExecutor(4) as executor:
+            list(executor.map(update_toml, [toml] * 4, range(4)))
+
+        # updates in many processes are never lost
+        queries = {query for _, query, _ in get_backend(toml).items()}
+        assert queries == {f"{w}-{i}" for w in range(4) for i in range(10)}
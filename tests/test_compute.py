@@ -1,11 +1,25 @@
 # standard library
+from asyncio import run
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import tzinfo
 from io import StringIO
+from threading import Barrier, Event
+from typing import Any, Optional
 
 
 # dependencies
+import numpy as np
 import pandas as pd
-from azely.azel import compute
+from azely import azel
+from azely.azel import _compute, _compute_chunks, _compute_many, _compute_sites, compute
+from azely.location import Location
+from azely.object import Object
+from azely.time import get_time, get_time_chunks
+from azely.utils import AzelyError, timings
 from pandas.testing import assert_frame_equal
+from pytest import MonkeyPatch, mark, raises
+from pytz import timezone
 
 
 # constants
@@ -38,6 +52,47 @@ Asia/Tokyo,az,el,lst
 2020-02-02 00:00:00+09:00,99.08617418966456,-20.549911723352988,0 days 19:14:09.163215600
 """
 
+objects = [
+    Object(
+        name="Sun",
+        longitude="NA",
+        latitude="NA",
+        frame="solar",
+    ),
+    Object(
+        name="3C 273",
+        longitude="12h29m06.69982572s",
+        latitude="2d03m08.59762998s",
+        frame="icrs",
+    ),
+    Object(
+        name="3C 345",
+        longitude="16h42m58.80997043s",
+        latitude="39d48m36.9939552s",
+        frame="icrs",
+    ),
+    Object(
+        name="GC",
+        longitude="0deg",
+        latitude="0deg",
+        frame="galactic",
+    ),
+]
+sites = [
+    Location(
+        name="Atacama Large Millimeter/submillimeter Array",
+        longitude="292d14m48.93972s",
+        latitude="-23d01m21.97704s",
+        altitude="0.0 m",
+    ),
+    Location(
+        name="Nobeyama Radio Astronomy Observatory",
+        longitude="138d28m25.28621699s",
+        latitude="35d56m34.76364s",
+        altitude="1350.0 m",
+    ),
+]
+
 
 # test functions
 def test_compute():
@@ -47,3 +102,190 @@ def test_compute():
 
     columns = ["az", "el"]
     assert_frame_equal(result[columns], expected[columns], atol=1e-3)
+
+
+def test_compute_many():
+    time = get_time("2020-02-01", "UTC", "1H")
+    result = _compute_many(objects, sites[0], time)
+
+    for obj in objects:
+        expected = _compute(obj, sites[0], time)
+        assert_frame_equal(result[obj.name], expected, atol=1e-6)
+
+
+def test_compute_many_unique():
+    time = get_time("2020-02-01", "UTC", "1H")
+    result = _compute_many([objects[1], objects[2], objects[1]], sites[0], time)
+    assert list(result.columns.get_level_values(0).unique()) == ["3C 273", "3C 345"]
+    assert list(result["3C 273"].columns) == ["az", "el", "lst"]
+
+    with raises(AzelyError):
+        _compute_many([], sites[0], time)
+
+
+def test_compute_sites():
+    time = get_time("2020-02-01", "UTC", "1H")
+
+    for obj in objects:
+        result = _compute_sites(obj, sites, time)
+
+        for site in sites:
+            expected = _compute(obj, site, time)
+            assert_frame_equal(result[site.name], expected, atol=1e-6)
+
+
+def test_compute_columns():
+    time = get_time("2020-02-01", "UTC", "10T")
+    result = _compute(objects[1], sites[0], time, columns=["el", "lst"], dtype="f4")
+    expected = _compute(objects[1], sites[0], time)
+
+    assert list(result.columns) == ["el", "lst"]
+    assert (result.dtypes == "float32").all()
+    assert_frame_equal(result[["el"]], expected[["el"]], check_dtype=False)
+    assert (abs(result.in_lst.index - expected.in_lst.index) < pd.Timedelta("1s")).all()
+
+
+def test_compute_views():
+    time = get_time("2020-02-01", "UTC", "10T")
+    result = _compute(objects[1], sites[0], time)
+
+    for view in ("in_lst", "in_utc"):
+        azel = getattr(result, view)
+        assert azel.index is getattr(result, view).index
+        assert np.shares_memory(azel.el.to_numpy(), result.el.to_numpy())
+
+    lst = result.in_lst.index
+    result.index = result.index.tz_convert("Asia/Tokyo")
+    assert result.in_lst.index is not lst
+    assert (result.in_lst.index == lst).all()
+
+    # the LST index is updated if the LST column is replaced
+    result["lst"] = result["lst"] + pd.Timedelta("1h")
+    diff = (result.in_lst.index - lst) % pd.Timedelta("1D")
+    assert (diff == pd.Timedelta("1h")).all()
+
+
+def test_compute_timings():
+    with timings() as records:
+        _compute(objects[1], sites[0], get_time("2020-02-01", "UTC", "10T"))
+
+    stages = ["view", "time", "obstime", "transform", "sidereal_time", "dataframe"]
+    assert [record.stage for record in records] == stages
+
+
+@mark.parametrize(
+    "view, expected, tzname",
+    [
+        ("", "timezone", "America/Santiago"),
+        ("ALMA", "timezone", "America/Santiago"),
+        ("UTC", "tzinfo", "UTC"),
+    ],
+)
+def test_compute_resolve(
+    monkeypatch: MonkeyPatch, view: str, expected: str, tzname: str
+):
+    calls: list[tuple[str, str]] = []
+    # object, site, and view (if not the site) must be resolved concurrently
+    barrier = Barrier(3 if expected == "tzinfo" else 2, timeout=10)
+
+    class Site(Location):
+        def get_timezone(self, source: Optional[Any] = None) -> tzinfo:
+            calls.append(("timezone", self.name))
+            return timezone("America/Santiago")
+
+    def get_object(query: str, **kwargs: Any) -> Object:
+        calls.append(("object", query))
+        barrier.wait()
+        return objects[1]
+
+    def get_location(query: str, **kwargs: Any) -> Location:
+        calls.append(("location", query))
+        barrier.wait()
+        return Site(**{**asdict(sites[0]), "name": query})
+
+    def get_tzinfo(view: str, timeout: int) -> tzinfo:
+        calls.append(("tzinfo", view))
+        barrier.wait()
+        return timezone(view)
+
+    monkeypatch.setattr(azel, "get_object", get_object)
+    monkeypatch.setattr(azel, "get_location", get_location)
+    monkeypatch.setattr(azel, "get_tzinfo", get_tzinfo)
+    object_, site_, tzinfo_ = azel._resolve("3C 273", "ALMA", view, "icrs", 10)
+
+    assert object_ == objects[1]
+    assert site_.name == "ALMA"
+    assert str(tzinfo_) == tzname
+    # the site is looked up only once (and reused as the view if needed)
+    assert sorted(calls) == [
+        ("location", "ALMA"),
+        ("object", "3C 273"),
+        (expected, view or "ALMA"),
+    ]
+
+
+def test_acompute_process_pool(monkeypatch: MonkeyPatch):
+    resolved = objects[1], sites[0], timezone("UTC")
+    monkeypatch.setattr(azel, "_resolve", lambda *args: resolved)
+
+    with ProcessPoolExecutor(1) as executor:
+        result = run(azel.acompute("3C 273", "ALMA", "2020-02-01", executor=executor))
+
+    expected = _compute(objects[1], sites[0], get_time("2020-02-01", "UTC"))
+    assert_frame_equal(result, expected)
+
+
+def test_compute_chunks():
+    time = get_time("2020-02-01 to 2020-02-03", "UTC", "10T")
+    times = get_time_chunks("2020-02-01 to 2020-02-03", "UTC", "10T", size=100)
+    progress: list[int] = []
+    results = list(
+        _compute_chunks(objects[1], sites[0], times, progress=progress.append)
+    )
+
+    expected = _compute(objects[1], sites[0], time)
+    assert [len(result) for result in results] == [100, 100, 89]
+    assert progress == [100, 200, 289]
+    assert_frame_equal(pd.concat(results), expected)
+
+
+def test_compute_chunks_cancel():
+    times = get_time_chunks("2020-02-01 to 2020-02-03", "UTC", "10T", size=100)
+    cancel = Event()
+
+    for result in _compute_chunks(objects[1], sites[0], times, cancel=cancel):
+        cancel.set()
+
+    assert len(result) == 100
+
+
+@mark.parametrize("obj", objects)
+@mark.parametrize("date", ["2005-06-01", "2020-02-01"])
+def test_compute_fast(obj: Object, date: str) -> None:
+    # UT1-UTC is about 0.6 s on 2005-06-01 (about 9 arcsec if ignored)
+    time = get_time(date, "UTC", "10T")
+    result = _compute(obj, sites[0], time, engine="fast")
+    expected = _compute(obj, sites[0], time)
+
+    assert_frame_equal(result[["el"]], expected[["el"]], atol=2 / 3600)
+
+
+@mark.parametrize("name", ["Sun", "Moon"])
+@mark.parametrize("tolerance", [0.1, 0.01])
+def test_compute_interpolated(name: str, tolerance: float) -> None:
+    obj = Object(name=name, longitude="NA", latitude="NA", frame="solar")
+    time = get_time("2020-02-01 to 2020-02-03", "UTC", "10T")
+    result = _compute(obj, sites[0], time, tolerance=tolerance)
+    expected = _compute(obj, sites[0], time)
+
+    # actual angular error (arcsec) against the exact (topocentric) position
+    az, el = np.deg2rad(result.az), np.deg2rad(result.el)
+    az_, el_ = np.deg2rad(expected.az), np.deg2rad(expected.el)
+    hav = (
+        np.sin((el - el_) / 2) ** 2
+        + np.cos(el) * np.cos(el_) * np.sin((az - az_) / 2) ** 2
+    )
+    error = np.rad2deg(2 * np.arcsin(np.sqrt(hav))).max() * 3600
+
+    assert 0.0 < result.attrs["ephemeris_error"] <= tolerance
+    assert error <= 1.5 * tolerance
@@ -0,0 +1,26 @@
+# standard library
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+# dependencies
+from azely.consts import Config, get_config
+
+
+# test functions
+def test_get_config() -> None:
+    with TemporaryDirectory() as dir:
+        toml = Path(dir) / "config.toml"
+
+        toml.write_text('[defaults]\nsite = "Tokyo"\ntimeout = 5\n')
+        assert get_config(toml) == Config(site="Tokyo", timeout=5.0)
+
+
+def test_get_config_bool() -> None:
+    with TemporaryDirectory() as dir:
+        toml = Path(dir) / "config.toml"
+        toml.write_text("[defaults]\ndayfirst = true\nyearfirst = true\n")
+        assert get_config(toml) == Config(dayfirst=True, yearfirst=True)
+
+        toml.write_text("[defaults]\noffline = true\n")
+        assert get_config(toml) == Config(offline=True)
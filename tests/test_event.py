@@ -0,0 +1,65 @@
+# dependencies
+from azely.azel import _compute
+from azely.event import _events, _visibility
+from azely.location import Location
+from azely.object import Object
+from azely.time import get_time
+from pandas import Series
+from pytest import mark
+
+
+# test data
+objects = [
+    Object(
+        name="Sun",
+        longitude="NA",
+        latitude="NA",
+        frame="solar",
+    ),
+    Object(
+        name="3C 273",
+        longitude="12h29m06.69982572s",
+        latitude="2d03m08.59762998s",
+        frame="icrs",
+    ),
+]
+site = Location(
+    name="Atacama Large Millimeter/submillimeter Array",
+    longitude="292d14m48.93972s",
+    latitude="-23d01m21.97704s",
+    altitude="0.0 m",
+)
+
+
+# test functions
+@mark.parametrize("obj", objects)
+def test_events(obj: Object) -> None:
+    time = get_time("2020-02-01 to 2020-02-03", "UTC", "10T")
+    result = _events(obj, site, time, el_limit=30.0)
+    expected = _compute(obj, site, get_time("2020-02-01 to 2020-02-03", "UTC", "2T"))
+
+    assert list(result.event) == ["rise", "transit", "set"] * 2
+    assert (abs(result.el[result.event != "transit"] - 30.0) < 0.01).all()
+
+    for index, transit in result[result.event == "transit"].iterrows():
+        day = expected.el[index.floor("D") : index.ceil("D")]
+        assert transit.el >= day.max() - 1e-4
+
+
+def test_visibility() -> None:
+    query = "2020-02-01 to 2020-02-03"
+    time = get_time(query, "UTC", "30T")
+    result = _visibility(objects[1:], site, time, min_el=30.0, max_el=60.0)
+    expected = _compute(objects[1], site, get_time(query, "UTC", "1T"))
+    expected = expected[time[0] : time[-1]]
+
+    assert (result.object == objects[1].name).all()
+    assert (result.start < result.end).all()
+
+    inside = (expected.el >= 30.0) & (expected.el <= 60.0)
+    within = Series(False, expected.index)
+
+    for _, interval in result.iterrows():
+        within[interval.start : interval.end] = True
+
+    assert (inside == within).all()
@@ -1,11 +1,16 @@
 # standard library
+from asyncio import run
 from dataclasses import asdict
-from tempfile import NamedTemporaryFile
+from pathlib import Path
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 
 
 # dependencies
-from azely.location import Location, get_location
-from pytest import mark
+from azely.backend import get_backend
+from azely.consts import AZELY_CACHE
+from azely.location import Location, aget_location, get_location, get_timezone
+from azely.utils import clear_cache, stage, timings
+from pytest import approx, mark
 from tomlkit import dump
 
 
@@ -42,3 +47,79 @@ def test_get_location(obj: Location) -> None:
         assert get_location(obj.name, source=f.name) == obj
         # read the object from the TOML file
         assert get_location(obj.name, source=f.name) == obj
+
+
+def test_aget_location() -> None:
+    obj = locations[0]
+
+    with NamedTemporaryFile("w", suffix=".toml") as f:
+        get_backend(f.name).update("location", {"ALMA": asdict(obj)})
+        assert run(aget_location("ALMA", source=f.name)) == obj
+
+
+def test_get_timezone() -> None:
+    with TemporaryDirectory() as dir:
+        source = Path(dir) / "cache.toml"
+        args = "139d41m30.12s", "35d41m22.2s", source
+
+        # find the timezone and save it to the TOML file
+        assert str(get_timezone(*args)) == "Asia/Tokyo"
+        assert get_backend(source).get("timezone", " ".join(args[:2]))
+
+
+def test_get_timezone_cache_hit() -> None:
+    with TemporaryDirectory() as dir:
+        source = Path(dir) / "cache.toml"
+        args = "151d12m33.6s", "-33d52m06.3s", source
+
+        with timings() as records:
+            for name in ["miss", "memory", "file"]:
+                if name == "file":
+                    clear_cache("timezone")
+
+                with stage(name):
+                    assert str(get_timezone(*args)) == "Australia/Sydney"
+
+    stages = [(record.stage, record.cache_hit) for record in records]
+    assert stages == [("miss", False), ("memory", True), ("file", True)]
+
+
+def test_location_timezone() -> None:
+    obj = Location("Sydney", "151d12m33.6s", "-33d52m06.3s")
+    mtime = AZELY_CACHE.stat().st_mtime_ns
+
+    # the timezone is never saved in the default cache file
+    assert str(obj.timezone) == "Australia/Sydney"
+    assert AZELY_CACHE.stat().st_mtime_ns == mtime
+
+    # the timezone is saved in the cache file of the location
+    with TemporaryDirectory() as dir:
+        source = Path(dir) / "cache.db"
+        assert str(obj.get_timezone(source)) == "Australia/Sydney"
+        assert get_backend(source).get("timezone", f"{obj.longitude} {obj.latitude}")
+
+
+def test_location_values() -> None:
+    obj = locations[0]
+
+    with TemporaryDirectory() as dir:
+        source = Path(dir) / "cache.toml"
+        get_backend(source).update("location", {"ALMA": asdict(obj)})
+
+        # the location round-trips through the cache file unchanged
+        result = get_location("ALMA", source=source)
+        assert result == obj
+        assert asdict(result) == get_backend(source).get("location", "ALMA")
+
+    assert result.values == approx((292.2469277, -23.0227714, 0.0))
+    assert result.to_earthlocation() is obj.to_earthlocation()
+
+
+def test_get_timezone_west() -> None:
+    # longitude over 180 deg (i.e., west of Greenwich)
+    assert str(get_timezone(locations[0].longitude, locations[0].latitude)) == (
+        "America/Santiago"
+    )
+    assert str(get_timezone(locations[1].longitude, locations[1].latitude)) == (
+        "America/Mexico_City"
+    )
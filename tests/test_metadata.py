@@ -1,3 +1,8 @@
+# standard library
+from subprocess import run
+from sys import executable
+
+
 # dependencies
 import azely
 
@@ -6,3 +11,13 @@ import azely
 def test_version():
     """Make sure the version is valid."""
     assert azely.__version__ == "0.7.0"
+
+
+def test_lazy_import():
+    """Make sure heavy dependencies are not imported with azely."""
+    code = "import azely, sys; print(*sys.modules)"
+    modules = run([executable, "-c", code], capture_output=True, text=True)
+    imported = set(modules.stdout.split())
+
+    for module in ("astropy", "ipinfo", "pandas", "timezonefinder", "tomlkit"):
+        assert module not in imported
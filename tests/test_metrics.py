@@ -0,0 +1,86 @@
+# standard library
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Optional
+
+
+# dependencies
+from azely.metrics import get_metrics, measure, reset_metrics, to_prometheus
+from azely.utils import PathLike, cache
+from pytest import raises
+
+
+# test data
+@dataclass
+class Data:
+    query: str
+
+
+@partial(cache, table="metrics")
+def get_data(
+    query: str,
+    /,
+    *,
+    source: Optional[PathLike],
+    update: bool = False,
+) -> Data:
+    return Data(query)
+
+
+@partial(measure, resolver="test")
+def resolve(error: Optional[Exception] = None) -> None:
+    if error is not None:
+        raise error
+
+
+# test functions
+def test_metrics_cache() -> None:
+    reset_metrics()
+
+    with NamedTemporaryFile("w", suffix=".toml") as f:
+        get_data("a", source=f.name)
+        get_data("a", source=f.name)
+        size = Path(f.name).stat().st_size
+
+    metrics = get_metrics()
+    assert metrics['azely_cache_misses_total{table="metrics"}'] == 1
+    assert metrics['azely_cache_updates_total{table="metrics"}'] == 1
+    assert metrics['azely_cache_hits_total{level="memory",table="metrics"}'] == 1
+    assert metrics['azely_cache_bytes_written_total{backend="toml"}'] == size
+
+
+def test_metrics_remote() -> None:
+    reset_metrics()
+    resolve()
+
+    with raises(TimeoutError):
+        resolve(TimeoutError())
+
+    with raises(ValueError):
+        resolve(ValueError("Request timed out"))
+
+    with raises(ValueError):
+        resolve(ValueError())
+
+    metrics = get_metrics()
+    assert metrics['azely_remote_calls_total{outcome="success",resolver="test"}'] == 1
+    assert metrics['azely_remote_calls_total{outcome="timeout",resolver="test"}'] == 2
+    assert metrics['azely_remote_calls_total{outcome="error",resolver="test"}'] == 1
+    assert metrics['azely_remote_timeouts_total{resolver="test"}'] == 2
+    assert metrics['azely_remote_latency_seconds_count{resolver="test"}'] == 4
+    assert (
+        metrics['azely_remote_latency_seconds_bucket{resolver="test",le="+Inf"}'] == 4
+    )
+
+
+def test_metrics_prometheus() -> None:
+    reset_metrics()
+    resolve()
+    lines = to_prometheus().splitlines()
+
+    assert "# TYPE azely_remote_latency_seconds histogram" in lines
+    assert "# TYPE azely_remote_calls_total counter" in lines
+    assert 'azely_remote_calls_total{outcome="success",resolver="test"} 1' in lines
+    assert 'azely_remote_latency_seconds_bucket{resolver="test",le="0.05"} 1' in lines
@@ -1,10 +1,19 @@
 # standard library
+from asyncio import run
 from dataclasses import asdict
-from tempfile import NamedTemporaryFile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from threading import Thread
+from urllib.parse import unquote, urlparse
 
 
 # dependencies
-from azely.object import Object, get_object
+import numpy as np
+from astropy.coordinates.name_resolve import sesame_url
+from astropy.utils.data import conf
+from azely.backend import get_backend
+from azely.object import Object, aget_object, get_object, get_objects
 from pytest import mark
 from tomlkit import dump
 
@@ -42,3 +51,74 @@ def test_get_object(obj: Object) -> None:
         assert get_object(obj.name, source=f.name) == obj
         # read the object from the TOML file
         assert get_object(obj.name, source=f.name) == obj
+
+
+def test_aget_object() -> None:
+    with NamedTemporaryFile("w", suffix=".toml") as f:
+        assert run(aget_object("Sun", source=f.name)) == objects[0]
+
+
+def test_object_values() -> None:
+    with TemporaryDirectory() as dir:
+        source = Path(dir) / "cache.toml"
+        items = {obj.name: asdict(obj) for obj in objects}
+        get_backend(source).update("object", items)
+
+        # the objects round-trip through the cache file unchanged
+        for obj in objects:
+            result = get_object(obj.name, source=source)
+            assert result == obj
+            assert asdict(result) == get_backend(source).get("object", obj.name)
+
+    assert np.isnan(objects[0].values).all()
+    assert np.allclose(objects[1].values, (187.27791594, 2.05238823))
+
+
+def test_get_objects() -> None:
+    responses = {
+        "3C 273": "%J 187.27791594 +02.05238823",
+        "3C 345": "%J 250.74504154 +39.81027610",
+    }
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            query = unquote(urlparse(self.path).query)
+            requests.append(query)
+
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(responses[query].encode())
+
+        def log_message(self, *args, **kwargs) -> None:
+            pass
+
+    timeout = conf.remote_timeout
+
+    with ThreadingHTTPServer(("127.0.0.1", 0), Handler) as server:
+        Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+        with TemporaryDirectory() as dir, sesame_url.set([url]):
+            source = Path(dir) / "cache.toml"
+            queries = ["Sun", "3C 273", "3C 345", "3C 273"]
+
+            # resolve objects by the stand-in server
+            result = get_objects(queries, source=source)
+            assert [obj.name for obj in result] == queries
+            assert sorted(requests) == ["3C 273", "3C 345"]
+
+            # read the objects from the cache file
+            assert get_objects(queries, source=source) == result
+            assert len(requests) == 2
+
+            # update the objects cached in the file and memory
+            assert get_object("3C 273", source=source) == result[1]
+            responses["3C 273"] = "%J 187.0 +02.0"
+            get_objects(queries, source=source, update=True)
+            assert get_object("3C 273", source=source).latitude == "2d00m00s"
+
+        # the remote timeout of concurrent resolvers is restored
+        assert conf.remote_timeout == timeout
+
+        server.shutdown()
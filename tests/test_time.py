@@ -1,6 +1,10 @@
 # dependencies
 import pandas as pd
-from azely.time import get_time
+from astropy.time import Time as ObsTime
+from azely.time import get_time, get_time_chunks, parse_time
+from dateutil.parser import parse
+from pytest import mark
+from pytz import timezone
 
 
 # constants
@@ -19,6 +23,60 @@ def test_time_by_tzinfo():
     assert (result == expected).all()
 
 
+def test_time_by_resolved_tzinfo():
+    result = get_time("2020-01-01 to 2020-01-07", timezone("Asia/Tokyo"), "10T")
+    assert (result == expected).all()
+
+
 def test_time_by_location():
     result = get_time("2020-01-01 to 2020-01-07", "Tokyo", "10T")
     assert (result == expected).all()
+
+
+def test_time_chunks():
+    query = "2020-01-01 to 2020-01-07"
+    results = list(get_time_chunks(query, "Asia/Tokyo", "10T", size=100))
+
+    assert max(len(result) for result in results) == 100
+    assert (results[0].append(results[1:]) == expected).all()
+
+
+def test_time_cached():
+    first = get_time("2020-01-01 to 2020-01-07", "Asia/Tokyo", "10T")
+    first.name = "renamed"
+    second = get_time("2020-01-01 to 2020-01-07", "Asia/Tokyo", "10T")
+
+    assert second is not first
+    assert second.name == "Asia/Tokyo"
+    assert (second == expected).all()
+
+
+@mark.parametrize("dayfirst", [False, True])
+def test_time_today(dayfirst: bool):
+    today = pd.Timestamp.now("UTC").normalize()
+    result = get_time("today", "UTC", "1H", dayfirst=dayfirst)
+    assert (result == pd.date_range(today, today + pd.Timedelta("1D"), freq="1H")).all()
+
+
+@mark.parametrize(
+    "query, dayfirst",
+    [
+        ("2020-01-02 03:04:05", False),
+        ("2020-01-02T03:04:05+09:00", False),
+        ("2020-01-02", True),
+        ("Jan. 2nd 2020", False),
+    ],
+)
+def test_parse_time(query: str, dayfirst: bool):
+    expected = parse(query, dayfirst=dayfirst)
+    assert parse_time(query, dayfirst, False) == expected
+
+
+def test_to_obstime():
+    # including the leap second at the end of 2016
+    time = get_time("2016-12-31 to 2017-01-01 12:00", "Asia/Tokyo", "7s")
+    expected = ObsTime(time.tz_convert(None))
+    result = time.to_obstime()
+
+    assert (result.jd1 == expected.jd1).all()
+    assert (result.jd2 == expected.jd2).all()
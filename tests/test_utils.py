@@ -0,0 +1,209 @@
+# standard library
+import subprocess
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from os import environ
+from pathlib import Path
+from sys import executable
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from threading import Barrier, Event, Thread, current_thread
+from time import perf_counter
+from typing import Optional
+
+
+# dependencies
+from astropy.utils.data import conf
+from azely.backend import get_backend
+from azely.object import get_object
+from azely.utils import (
+    AzelyError,
+    PathLike,
+    cache,
+    clear_cache,
+    remote_timeout,
+    run_async,
+    set_cache_size,
+    set_offline,
+    stage,
+    timings,
+)
+from pytest import raises
+
+
+# test data
+@dataclass
+class Data:
+    query: str
+    count: int
+
+
+counts = {"call": 0}
+
+
+@partial(cache, table="data")
+def get_data(
+    query: str,
+    /,
+    *,
+    source: Optional[PathLike],
+    update: bool = False,
+) -> Data:
+    counts["call"] += 1
+    return Data(query, counts["call"])
+
+
+# test functions
+def test_cache_in_memory() -> None:
+    with NamedTemporaryFile("w", suffix=".toml") as f:
+        first = get_data("a", source=f.name)
+        # read the object from memory even if the TOML file is emptied
+        open(f.name, "w").close()
+        assert get_data("a", source=f.name) == first
+
+        # read the object again after the memory is cleared
+        clear_cache("data", "a")
+        assert get_data("a", source=f.name) != first
+
+
+def test_cache_size() -> None:
+    with NamedTemporaryFile("w", suffix=".toml") as f:
+        set_cache_size(1)
+
+        try:
+            first = get_data("b", source=f.name)
+            get_data("c", source=f.name)
+
+            # the least recently used object is evicted
+            open(f.name, "w").close()
+            assert get_data("b", source=f.name) != first
+        finally:
+            set_cache_size(1024)
+
+
+def test_cache_read_only() -> None:
+    with NamedTemporaryFile("w", suffix=".toml") as f:
+        get_data("d", source=f.name)
+        clear_cache()
+
+        # the TOML file is not rewritten by a cache hit
+        mtime = Path(f.name).stat().st_mtime_ns
+        get_data("d", source=f.name)
+        assert Path(f.name).stat().st_mtime_ns == mtime
+
+
+def test_offline() -> None:
+    item = dict(
+        name="NGC1068",
+        longitude="2h42m40.771s",
+        latitude="-0d00m47.84s",
+        frame="icrs",
+    )
+
+    with NamedTemporaryFile("w", suffix=".toml") as f:
+        get_backend(f.name).update("object", {"NGC1068": item})
+        set_offline()
+
+        try:
+            assert not conf.allow_internet
+            assert get_object("NGC1068", source=f.name).longitude == item["longitude"]
+
+            # an uncached object fails immediately without network access
+            start = perf_counter()
+
+            with raises(AzelyError):
+                get_object("NGC4038", source=f.name, timeout=10)
+
+            assert perf_counter() - start < 1.0
+        finally:
+            set_offline(False)
+
+    assert conf.allow_internet
+
+
+def test_timings() -> None:
+    with NamedTemporaryFile("w", suffix=".toml") as f:
+        with timings() as records:
+            with stage("miss"):
+                get_data("e", source=f.name)
+
+            with stage("hit"):
+                get_data("e", source=f.name)
+
+            with stage("uncached"):
+                pass
+
+    stages = [(record.stage, record.cache_hit) for record in records]
+    assert stages == [("miss", False), ("hit", True), ("uncached", None)]
+
+    # nothing is recorded out of the context
+    with stage("disabled"):
+        get_data("e", source=f.name)
+
+    assert len(records) == 3
+
+
+def test_run_async() -> None:
+    def work() -> str:
+        with stage("work"):
+            return current_thread().name
+
+    with ThreadPoolExecutor(thread_name_prefix="azely") as executor:
+        with timings() as records:
+            name = run(run_async(work, executor=executor))
+
+    # the context (timings) is propagated to the executor
+    assert name.startswith("azely")
+    assert [record.stage for record in records] == ["work"]
+
+
+def test_offline_exit() -> None:
+    code = "\n".join(
+        [
+            "import azely",
+            "azely.utils.set_offline()",
+            "azely.compute('Sun', 'ALMA', '2020-02-01', view='UTC')",
+        ]
+    )
+    item = dict(
+        name="ALMA",
+        longitude="292d14m48.93972s",
+        latitude="-23d01m21.97704s",
+        altitude="0.0 m",
+    )
+
+    with TemporaryDirectory() as dir:
+        get_backend(Path(dir) / "cache.toml").update("location", {"ALMA": item})
+        env = {**environ, "AZELY_DIR": dir}
+        result = subprocess.run([executable, "-c", code], env=env, capture_output=True)
+
+    # astropy's settings are restored before they are torn down
+    assert result.returncode == 0, result.stderr.decode()
+    assert b"Exception ignored" not in result.stderr
+
+
+def test_remote_timeout() -> None:
+    original = conf.remote_timeout
+    entered, release = Barrier(4), Event()
+
+    def resolve(timeout: float) -> None:
+        with remote_timeout.set(timeout):
+            entered.wait()
+            release.wait()
+
+    threads = [Thread(target=resolve, args=(t,)) for t in (3.0, 5.0, 4.0)]
+
+    for thread in threads:
+        thread.start()
+
+    # the longest timeout is set while overlapping resolvers run
+    entered.wait()
+    assert conf.remote_timeout == 5.0
+    release.set()
+
+    for thread in threads:
+        thread.join()
+
+    # the original timeout is restored after all of them end
+    assert conf.remote_timeout == original